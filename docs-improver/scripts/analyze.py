@@ -7,28 +7,33 @@ Analyzes documentation completeness, accuracy, clarity, structure, and maintaina
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
+from file_index import MAX_BYTES, SKIP_DIRS, FileIndex, read_text
+from models import QualityIssue, QualityReport
 
-@dataclass
-class QualityReport:
-    """Documentation quality report"""
-    overall_score: int = 0
-    completeness_score: int = 0
-    accuracy_score: int = 0
-    clarity_score: int = 0
-    structure_score: int = 0
-    maintainability_score: int = 0
-    
-    files_analyzed: List[Dict] = field(default_factory=list)
-    issues: List[Dict] = field(default_factory=list)
-    recommendations: Dict[str, List[str]] = field(default_factory=lambda: {
-        'quick_wins': [],
-        'short_term': [],
-        'long_term': []
-    })
+
+# Every token the quality checks look at, matched in a single pass.
+# Each alternative is a named group; _extract_features dispatches on lastgroup.
+_FEATURE_RE = re.compile(
+    r'^(?P<heading>#{1,6})\s'
+    r'|^ {0,3}(?P<fence>```)'
+    r'|^[ \t]*(?P<list>[-*+]|\d+\.)\s'
+    r'|(?P<todo>TODO|FIXME)'
+    r'|(?P<link>\]\()'
+    r'|(?P<url>https?://)'
+    r'|(?i:(?P<install>install)|(?P<usage>usage|example)|(?P<toc>toc|contents))',
+    re.MULTILINE
+)
+# Features only counted outside code blocks: a shell '# comment' is not a
+# heading and an array index is not a link. Install/usage keywords and the
+# rest are still counted inside fences, where install commands usually live.
+_PROSE_ONLY = frozenset({'heading', 'link'})
+
+# Scoring dimensions, in the column order of each per-file score row,
+# and their weight in the overall score
+_DIMENSIONS = ('completeness', 'accuracy', 'clarity', 'structure', 'maintainability')
+_WEIGHTS = (0.30, 0.10, 0.25, 0.20, 0.15)
 
 
 class DocsAnalyzer:
@@ -36,26 +41,23 @@ class DocsAnalyzer:
     
     ESSENTIAL_DOCS = ['README.md', 'README.rst', 'README.txt']
     IMPORTANT_DOCS = ['CHANGELOG.md', 'CONTRIBUTING.md', 'LICENSE', 'API.md', 'ARCHITECTURE.md']
+    DOC_SUFFIXES = ('.md', '.rst', '.txt', '.adoc')
+    EXCLUDE_DIRS = SKIP_DIRS
     
-    def __init__(self, path: str):
+    def __init__(self, path: str, index: Optional[FileIndex] = None):
         self.root_path = Path(path).resolve()
+        self._root_str = str(self.root_path)
+        self.index = index or FileIndex(self._root_str, self.EXCLUDE_DIRS)
         self.report = QualityReport()
-        self.doc_files: List[Path] = []
+        self.doc_files: List[str] = []
         
-    def scan(self) -> List[Path]:
+    def scan(self) -> List[str]:
         """Scan for documentation files"""
         print(f"📚 Scanning documentation in: {self.root_path}")
         
-        # Find all markdown and text files
-        for pattern in ['*.md', '*.rst', '*.txt', '*.adoc']:
-            self.doc_files.extend(self.root_path.rglob(pattern))
-        
-        # Filter out node_modules, vendor, etc.
-        exclude_dirs = {'node_modules', 'vendor', '.git', 'dist', 'build'}
-        self.doc_files = [
-            f for f in self.doc_files 
-            if not any(exclude in str(f) for exclude in exclude_dirs)
-        ]
+        # Find all markdown and text files; the index prunes node_modules,
+        # vendor, etc. and is shared with the other tools when one is passed in
+        self.doc_files.extend(self.index.files(self.DOC_SUFFIXES))
         
         print(f"  Found {len(self.doc_files)} documentation files")
         return self.doc_files
@@ -66,102 +68,118 @@ class DocsAnalyzer:
         
         if not self.doc_files:
             self.report.overall_score = 0
-            self.report.issues.append({
-                'severity': 'critical',
-                'type': 'no_docs',
-                'description': 'No documentation files found',
-                'fix': 'Create README.md with project overview'
-            })
+            self.report.issues.append(QualityIssue(
+                severity='critical',
+                type='no_docs',
+                description='No documentation files found',
+                fix='Create README.md with project overview'
+            ))
             return self.report
         
-        # Analyze each file
-        scores = []
+        # Analyze each file into a row of dimension scores plus the overall
+        rows = []
         for file_path in self.doc_files:
-            score = self._analyze_file(file_path)
-            scores.append(score)
+            # Skip generated dumps before reading them; they are not prose
+            size = os.path.getsize(file_path)
+            if size > MAX_BYTES:
+                continue
+            row = self._analyze_file(file_path)
+            rows.append(row)
             self.report.files_analyzed.append({
-                'path': str(file_path.relative_to(self.root_path)),
-                'size': file_path.stat().st_size,
-                'score': score['overall']
+                'path': os.path.relpath(file_path, self._root_str),
+                'size': size,
+                'score': row[-1]
             })
         
-        # Calculate overall scores
-        if scores:
-            self.report.overall_score = sum(s['overall'] for s in scores) // len(scores)
-            self.report.completeness_score = sum(s['completeness'] for s in scores) // len(scores)
-            self.report.accuracy_score = sum(s['accuracy'] for s in scores) // len(scores)
-            self.report.clarity_score = sum(s['clarity'] for s in scores) // len(scores)
-            self.report.structure_score = sum(s['structure'] for s in scores) // len(scores)
-            self.report.maintainability_score = sum(s['maintainability'] for s in scores) // len(scores)
+        # Average every column in one pass over the transposed rows
+        if rows:
+            count = len(rows)
+            averages = [sum(column) // count for column in zip(*rows)]
+            for name, average in zip(_DIMENSIONS, averages):
+                setattr(self.report, f'{name}_score', average)
+            self.report.overall_score = averages[-1]
         
         # Generate recommendations
         self._generate_recommendations()
         
         return self.report
     
-    def _analyze_file(self, file_path: Path) -> Dict:
-        """Analyze a single documentation file"""
-        scores = {
-            'overall': 0,
-            'completeness': 0,
-            'accuracy': 0,
-            'clarity': 0,
-            'structure': 0,
-            'maintainability': 0
-        }
+    def _analyze_file(self, file_path: str) -> Tuple[int, ...]:
+        """Analyze a single documentation file
         
+        Returns the scores in _DIMENSIONS order followed by the weighted overall.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            content = read_text(file_path)
         except Exception as e:
-            return scores
+            return (0,) * (len(_DIMENSIONS) + 1)
         
-        # Completeness (30%)
-        scores['completeness'] = self._check_completeness(content, file_path.name)
+        features = self._extract_features(content)
         
-        # Clarity (25%)
-        scores['clarity'] = self._check_clarity(content)
-        
-        # Structure (20%)
-        scores['structure'] = self._check_structure(content)
-        
-        # Maintainability (15%)
-        scores['maintainability'] = self._check_maintainability(content)
-        
-        # Accuracy (10%) - Hard to assess automatically
-        scores['accuracy'] = 70  # Default
+        dimensions = (
+            self._check_completeness(content, os.path.basename(file_path), features),
+            70,  # Accuracy - hard to assess automatically, default
+            self._check_clarity(content, features),
+            self._check_structure(features),
+            self._check_maintainability(content, features),
+        )
         
         # Weighted overall
-        scores['overall'] = int(
-            scores['completeness'] * 0.30 +
-            scores['accuracy'] * 0.10 +
-            scores['clarity'] * 0.25 +
-            scores['structure'] * 0.20 +
-            scores['maintainability'] * 0.15
-        )
+        overall = int(sum(score * weight for score, weight in zip(dimensions, _WEIGHTS)))
         
-        return scores
+        return dimensions + (overall,)
+    
+    def _extract_features(self, content: str) -> Dict:
+        """Collect every token-level feature the checks need in one regex pass"""
+        features = {
+            'headings': [0] * 7,  # index 1-6 = H1-H6
+            'fence': 0,
+            'list': 0,
+            'todo': 0,
+            'link': 0,
+            'url': 0,
+            'install': 0,
+            'usage': 0,
+            'toc': 0,
+            'balanced_fences': True,
+        }
+        # Fence markers toggle in_fence; headings and links matched inside a
+        # code block are not part of the prose
+        in_fence = False
+        for match in _FEATURE_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == 'fence':
+                in_fence = not in_fence
+                features['fence'] += 1
+            elif in_fence and kind in _PROSE_ONLY:
+                continue
+            elif kind == 'heading':
+                features['headings'][len(match.group('heading'))] += 1
+            else:
+                features[kind] += 1
+        features['balanced_fences'] = not in_fence
+        return features
     
-    def _check_completeness(self, content: str, filename: str) -> int:
+    def _check_completeness(self, content: str, filename: str, features: Dict) -> int:
         """Check documentation completeness"""
         checks = [
-            ('has_title', '#' in content),
+            ('has_title', any(features['headings'])),
             ('has_description', len(content) > 200),
-            ('has_sections', content.count('## ') >= 2),
-            ('has_code_examples', '```' in content),
-            ('has_links', '](' in content or 'http' in content),
+            ('has_sections', features['headings'][2] >= 2),
+            ('has_code_examples', features['fence'] > 0),
+            ('has_links', features['link'] > 0 or features['url'] > 0),
         ]
         
         if filename.startswith('README'):
             checks.extend([
-                ('has_installation', 'install' in content.lower()),
-                ('has_usage', 'usage' in content.lower() or 'example' in content.lower()),
+                ('has_installation', features['install'] > 0),
+                ('has_usage', features['usage'] > 0),
             ])
         
         passed = sum(1 for _, check in checks if check)
         return min(100, passed * 100 // len(checks))
     
-    def _check_clarity(self, content: str) -> int:
+    def _check_clarity(self, content: str, features: Dict) -> int:
         """Check documentation clarity"""
         score = 100
         
@@ -171,11 +189,11 @@ class DocsAnalyzer:
         score -= min(30, long_paragraphs * 5)
         
         # Reward use of lists
-        if '-' in content or '*' in content or '1.' in content:
+        if features['list']:
             score += 10
         
         # Reward use of headings
-        heading_count = content.count('#')
+        heading_count = sum(features['headings'])
         if heading_count >= 5:
             score += 10
         elif heading_count >= 3:
@@ -183,29 +201,30 @@ class DocsAnalyzer:
         
         return max(0, min(100, score))
     
-    def _check_structure(self, content: str) -> int:
+    def _check_structure(self, features: Dict) -> int:
         """Check documentation structure"""
         score = 0
+        headings = features['headings']
         
         # Check heading hierarchy
-        if '# ' in content:
+        if headings[1]:
             score += 20  # Has H1
-        if '## ' in content:
+        if headings[2]:
             score += 30  # Has H2
-        if '### ' in content:
+        if headings[3]:
             score += 20  # Has H3
         
         # Check for table of contents
-        if 'toc' in content.lower() or 'contents' in content.lower():
+        if features['toc']:
             score += 15
         
         # Check for consistent formatting
-        if content.count('```') % 2 == 0:  # Balanced code blocks
+        if features['balanced_fences']:  # Every code block is closed
             score += 15
         
         return min(100, score)
     
-    def _check_maintainability(self, content: str) -> int:
+    def _check_maintainability(self, content: str, features: Dict) -> int:
         """Check documentation maintainability"""
         score = 100
         
@@ -214,12 +233,11 @@ class DocsAnalyzer:
             score -= 20
         
         # Penalize outdated content indicators
-        if 'TODO' in content or 'FIXME' in content:
+        if features['todo']:
             score -= 15
         
         # Reward internal linking
-        internal_links = len([l for l in content.split() if l.startswith('[') and '](' in l])
-        if internal_links >= 5:
+        if features['link'] >= 5:
             score += 15
         
         return max(0, min(100, score))
@@ -229,22 +247,23 @@ class DocsAnalyzer:
         report = self.report
         
         if report.completeness_score < 60:
-            report.recommendations['quick_wins'].append('Add project description and badges')
-            report.recommendations['quick_wins'].append('Add code examples')
+            report.quick_wins.append('Add project description and badges')
+            report.quick_wins.append('Add code examples')
         
         if report.structure_score < 60:
-            report.recommendations['short_term'].append('Improve document structure with clear sections')
-            report.recommendations['short_term'].append('Add table of contents')
+            report.short_term.append('Improve document structure with clear sections')
+            report.short_term.append('Add table of contents')
         
         if report.maintainability_score < 60:
-            report.recommendations['long_term'].append('Break down large documents')
-            report.recommendations['long_term'].append('Remove TODOs and FIXMEs')
+            report.long_term.append('Break down large documents')
+            report.long_term.append('Remove TODOs and FIXMEs')
         
-        report.recommendations['long_term'].append('Set up automated documentation generation')
-        report.recommendations['long_term'].append('Establish documentation review process')
+        report.long_term.append('Set up automated documentation generation')
+        report.long_term.append('Establish documentation review process')
     
     def export_report(self, output_path: str):
         """Export quality report to Markdown"""
+        from datetime import datetime
         report = self.report
         
         md = []
@@ -267,24 +286,24 @@ class DocsAnalyzer:
         if report.issues:
             md.append("\n## Issues\n")
             for issue in report.issues:
-                md.append(f"- **[{issue['severity'].upper()}]** {issue['description']}")
-                md.append(f"  - Fix: {issue['fix']}\n")
+                md.append(f"- **[{issue.severity.upper()}]** {issue.description}")
+                md.append(f"  - Fix: {issue.fix}\n")
         
         md.append("\n## Recommendations\n")
         md.append("\n### Quick Wins\n")
-        for rec in report.recommendations['quick_wins']:
+        for rec in report.quick_wins:
             md.append(f"- [ ] {rec}")
         
         md.append("\n### Short Term\n")
-        for rec in report.recommendations['short_term']:
+        for rec in report.short_term:
             md.append(f"- [ ] {rec}")
         
         md.append("\n### Long Term\n")
-        for rec in report.recommendations['long_term']:
+        for rec in report.long_term:
             md.append(f"- [ ] {rec}")
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(md))
+            f.writelines(line + '\n' for line in md)
         
         print(f"✅ Report saved to: {output_path}")
     
@@ -4,18 +4,22 @@ Docs Improver - Main Entry Point
 Analyze, Generate, Check, and Improve Documentation
 """
 
-import argparse
-import sys
+import importlib
 from pathlib import Path
 
 # Import modules
 from analyze import DocsAnalyzer
+from file_index import FileIndex
 from generate import DocsGenerator
-from consistency_check import ConsistencyChecker
 from improve import DocsImprover
 
+# The module file name has a hyphen, so it cannot be imported by statement
+ConsistencyChecker = importlib.import_module('consistency-check').ConsistencyChecker
+
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Docs Improver - Complete Documentation Tool',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -42,11 +46,14 @@ Examples:
     print(f"📚 Docs Improver - {args.mode.title()} Mode")
     print(f"Path: {args.path}\n")
     
+    # One listing of the project, shared by every stage below
+    index = FileIndex(str(Path(args.path).resolve()))
+    
     if args.mode in ['analyze', 'all']:
         print("=" * 60)
         print("📊 DOCUMENTATION QUALITY ANALYSIS")
         print("=" * 60)
-        analyzer = DocsAnalyzer(args.path)
+        analyzer = DocsAnalyzer(args.path, index)
         analyzer.scan()
         report = analyzer.analyze()
         
@@ -64,14 +71,14 @@ Examples:
         print("\n" + "=" * 60)
         print("📝 DOCUMENTATION GENERATION")
         print("=" * 60)
-        generator = DocsGenerator(args.path)
+        generator = DocsGenerator(args.path, index)
         generator.generate_all(args.output)
     
     if args.mode in ['check', 'all']:
         print("\n" + "=" * 60)
         print("🔍 CONSISTENCY CHECK")
         print("=" * 60)
-        checker = ConsistencyChecker(args.path)
+        checker = ConsistencyChecker(args.path, index)
         issues = checker.check_all()
         
         print(f"\n🔍 Found {len(issues)} issues")
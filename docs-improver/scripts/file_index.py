@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Project File Walker
+Directory traversal, file index and cached reads shared by the docs-improver scripts.
+"""
+
+import functools
+import os
+import subprocess
+from collections import deque
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+
+# Thread count for per-file scans; reads release the GIL, so oversubscribe
+MAX_WORKERS = (os.cpu_count() or 1) * 2
+
+# Files larger than this are minified bundles, data dumps or LFS payloads,
+# never hand-written docs or sources worth scanning
+MAX_BYTES = 2 * 1024 * 1024
+
+# Dependency, VCS, cache and build output directories; never project sources
+SKIP_DIRS = frozenset({
+    '.git', '.hg', '.svn',
+    'node_modules', 'vendor', '.venv', 'venv', 'env', 'site-packages', '.yarn',
+    '__pycache__', '.tox', '.mypy_cache', '.pytest_cache', '.docs_cache',
+    'dist', 'build', 'target',
+})
+
+
+def iter_files(root: str, suffixes: Tuple[str, ...], skip_dirs: FrozenSet[str] = SKIP_DIRS,
+               max_depth: Optional[int] = None) -> Iterator[str]:
+    """Yield paths of files under root ending in suffixes, never descending into skip_dirs
+    
+    Symlinks are neither followed nor yielded, so links pointing outside the
+    project (or nowhere) are never read. The walk is breadth-first, so
+    shallow files (where entry points and top-level docs live) come out
+    first. Directories more than max_depth levels below root are not
+    entered; None means no limit.
+    """
+    queue = deque([(root, 0)])
+    while queue:
+        path, depth = queue.popleft()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # DirEntry caches its type, so no extra stat() per entry
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs and (max_depth is None or depth < max_depth):
+                            queue.append((entry.path, depth + 1))
+                    elif entry.name.endswith(suffixes) and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def git_files(root: str, skip_dirs: FrozenSet[str] = SKIP_DIRS,
+              max_depth: Optional[int] = None) -> Optional[List[str]]:
+    """List tracked and untracked-but-not-ignored files via git, or None outside a repo
+    
+    Files are ordered shallowest first, matching iter_files.
+    """
+    def ls_files(*args: str) -> List[bytes]:
+        out = subprocess.run(['git', '-C', root, 'ls-files', '-z', *args],
+                             capture_output=True, check=True).stdout
+        return [rel for rel in out.split(b'\0') if rel]
+    
+    try:
+        listed = ls_files('--cached', '--others', '--exclude-standard')
+        deleted = set(ls_files('--deleted'))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    
+    files = []
+    for rel in listed:
+        if rel in deleted:
+            continue
+        parts = os.fsdecode(rel).split('/')
+        if max_depth is not None and len(parts) - 1 > max_depth:
+            continue
+        # .gitignore usually covers these already, but honor skip_dirs either way
+        if skip_dirs.isdisjoint(parts[:-1]):
+            files.append((len(parts), os.path.join(root, *parts)))
+    files.sort(key=lambda item: item[0])
+    return [path for _, path in files]
+
+
+@functools.lru_cache(maxsize=None)
+def read_text(path: str) -> str:
+    """Read a file as UTF-8 once per run; later calls for the same path are free
+    
+    Files over MAX_BYTES read as empty, so no scanner pays for them.
+    """
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        if os.fstat(f.fileno()).st_size > MAX_BYTES:
+            return ''
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def read_bytes(path: str, limit: int = -1) -> bytes:
+    """Raw counterpart of read_text for scanners that only match ASCII literals
+    
+    Reads at most limit bytes (all when negative). Empty and oversized
+    files return b'' without a read.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or size > MAX_BYTES:
+            return b''
+        return f.read(limit)
+
+
+@dataclass
+class FileIndex:
+    """Every file under a project root, bucketed by suffix and name from one walk"""
+    root: str
+    skip_dirs: FrozenSet[str] = SKIP_DIRS
+    max_depth: Optional[int] = None
+    by_suffix: Dict[str, List[str]] = field(default_factory=dict)
+    by_name: Dict[str, str] = field(default_factory=dict)
+    _built: bool = False
+    
+    def _build_index(self):
+        """List the tree once and bucket every file"""
+        # git already knows the file list and what is ignored; walk the
+        # filesystem only outside a repo or when git lists nothing here
+        paths = git_files(self.root, self.skip_dirs, self.max_depth)
+        if not paths:
+            # Every name ends with '', so this yields all files
+            paths = iter_files(self.root, ('',), self.skip_dirs, self.max_depth)
+        for path in paths:
+            name = os.path.basename(path)
+            self.by_suffix.setdefault(os.path.splitext(name)[1], []).append(path)
+            self.by_name.setdefault(name, path)
+        self._built = True
+    
+    def add(self, path: str):
+        """Record a file written during the run, so tools sharing this index see it
+        
+        The read caches are dropped too, since the file may have replaced
+        one that was already read. Files outside the root (an --output
+        directory elsewhere) are not part of the project and are not indexed.
+        """
+        read_text.cache_clear()
+        read_bytes.cache_clear()
+        if not self._built:
+            return
+        root = os.path.realpath(self.root)
+        if os.path.commonpath((root, os.path.realpath(path))) != root:
+            return
+        name = os.path.basename(path)
+        bucket = self.by_suffix.setdefault(os.path.splitext(name)[1], [])
+        if path not in bucket:
+            bucket.append(path)
+        self.by_name.setdefault(name, path)
+    
+    def files(self, suffixes: Tuple[str, ...]) -> List[str]:
+        """Paths of all indexed files with one of the given suffixes"""
+        if not self._built:
+            self._build_index()
+        if len(suffixes) == 1:
+            return self.by_suffix.get(suffixes[0], [])
+        return [path for suffix in suffixes for path in self.by_suffix.get(suffix, [])]
+    
+    @property
+    def md_files(self) -> List[str]:
+        return self.files(('.md',))
+    
+    @property
+    def py_files(self) -> List[str]:
+        return self.files(('.py',))
@@ -4,33 +4,45 @@ Documentation Generator
 Generates README, API docs, and other documentation from code.
 """
 
+import ast
 import os
 import re
-import json
+import functools
+import hashlib
+import mmap
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-from datetime import datetime
-
-
-class DocsGenerator:
-    """Generate documentation from code"""
-    
-    def __init__(self, path: str):
-        self.root_path = Path(path).resolve()
-        self.generated_files: List[str] = []
-    
-    def generate_readme(self, output: Optional[str] = None) -> str:
-        """Generate README.md"""
-        print("📝 Generating README.md...")
-        
-        project_name = self.root_path.name
-        description = self._get_description()
-        install_steps = self._get_install_steps()
-        usage_examples = self._get_usage_examples()
-        
-        quick_start = install_steps if install_steps else '# Clone and install\ngit clone <repository-url>\nnpm install'
-        
-        content = f"""# {project_name.title().replace('-', ' ')}
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from file_index import MAX_BYTES, MAX_WORKERS, FileIndex, read_bytes
+
+
+# Flask/FastAPI route decorators in one pattern: @app.get('/x'), @router.post('/x')
+# and @app.route('/x', methods=['GET', 'POST'])
+# Matched on raw bytes; only the captured groups are ever decoded
+_ROUTE_RE = re.compile(
+    rb'@(?:app|router)\.(?P<method>(?i:get|post|put|delete|patch|route))\([\'"](?P<path>[^\'"]+)[\'"]'
+    rb'(?:\s*,\s*methods=\[(?P<methods>[^\]]+)\])?'
+)
+# Read at most this much of each module, and at most this many modules
+# (shallowest first), when looking for routes
+_ROUTE_SCAN_BYTES = 256 * 1024
+_ROUTE_SCAN_FILES = 4096
+# Below this size a plain read() beats setting up a memory map
+_ROUTE_MMAP_BYTES = 32 * 1024
+# Endpoint scan results are cached on disk for a day; bump the version
+# whenever the scan itself changes so stale results are not reused
+_CACHE_DIR = '.docs_cache'
+_CACHE_TTL = 24 * 60 * 60
+_CACHE_VERSION = b'endpoints-1'
+_SETUP_DESCRIPTION_RE = re.compile(rb'description=[\'"]([^\'"]+)[\'"]')
+_WORD_RE = re.compile(rb'\w+')
+
+
+# Document templates, filled with str.format (so literal braces are doubled)
+_README_TEMPLATE = """# {title}
 
 [![License](https://img.shields.io/badge/license-MIT-blue.svg)](LICENSE)
 [![Status](https://img.shields.io/badge/status-active-success.svg)]()
@@ -43,7 +55,7 @@ class DocsGenerator:
 
 ## 📝 About
 
-{description if description else 'A brief description of the project goes here.'}
+{description}
 
 ## ✨ Features
 
@@ -54,12 +66,12 @@ class DocsGenerator:
 ## 📦 Installation
 
 ```bash
-{install_steps if install_steps else '# Add installation steps here'}
+{install_steps}
 ```
 
 ## 💡 Usage
 
-{usage_examples if usage_examples else '```python\n# Example usage\n# Add your usage examples here\n```'}
+{usage}
 
 ## 📚 Documentation
 
@@ -82,27 +94,10 @@ Contributions are welcome! Please read our [Contributing Guidelines](CONTRIBUTIN
 
 This project is licensed under the MIT License - see the [LICENSE](LICENSE) file for details.
 """
-        
-        output_path = output or (self.root_path / 'README.md')
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        self.generated_files.append(str(output_path))
-        print(f"✅ Generated: {output_path}")
-        return content
-    
-    def generate_api_docs(self, output: Optional[str] = None) -> str:
-        """Generate API.md"""
-        print("📝 Generating API.md...")
-        
-        endpoints = self._extract_api_endpoints()
-        
-        content = f"""# API Documentation
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+_API_HEADER_TEMPLATE = """# API Documentation
+
+**Generated:** {generated}
 
 ## Overview
 
@@ -121,13 +116,11 @@ This document describes the API endpoints available in this project.
 ## Endpoints
 
 """
-        
-        if endpoints:
-            for endpoint in endpoints:
-                content += f"""
-### {endpoint.get('method', 'GET')} `{endpoint.get('path', '/unknown')}`
 
-{endpoint.get('description', 'API endpoint')}
+_ENDPOINT_TEMPLATE = """
+### {method} `{path}`
+
+{description}
 
 **Parameters:**
 
@@ -148,31 +141,12 @@ This document describes the API endpoints available in this project.
 ```
 
 """
-        else:
-            content += "\n*No API endpoints detected. Add API documentation manually.*\n"
-        
-        output_path = output or (self.root_path / 'docs' / 'API.md')
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
-        
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        self.generated_files.append(str(output_path))
-        print(f"✅ Generated: {output_path}")
-        return content
-    
-    def generate_architecture(self, output: Optional[str] = None) -> str:
-        """Generate ARCHITECTURE.md"""
-        print("📝 Generating ARCHITECTURE.md...")
-        
-        components = self._detect_components()
-        
-        content = f"""# Architecture Documentation
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+_NO_ENDPOINTS = "\n*No API endpoints detected. Add API documentation manually.*\n"
+
+_ARCHITECTURE_HEADER_TEMPLATE = """# Architecture Documentation
+
+**Generated:** {generated}
 
 ## System Overview
 
@@ -190,11 +164,9 @@ graph TB
 ## Components
 
 """
-        
-        if components:
-            for comp in components:
-                content += f"""
-### {comp}
+
+_COMPONENT_TEMPLATE = """
+### {name}
 
 **Purpose:** {{Component purpose}}
 
@@ -205,10 +177,11 @@ graph TB
 **Technologies:** {{Technologies}}
 
 """
-        else:
-            content += "\n*Components not detected automatically. Add architecture details manually.*\n"
-        
-        content += """
+
+_NO_COMPONENTS = "\n*Components not detected automatically. Add architecture details manually.*\n"
+
+# Written verbatim, not formatted: the doubled braces appear as-is in the output
+_ARCHITECTURE_FOOTER = """
 ## Data Flow
 
 {{Data flow description}}
@@ -235,108 +208,323 @@ graph TB
 
 **Consequences:** {{Impact}}
 """
+
+
+def _match_routes(content, file_path: str, root: str) -> List[Dict]:
+    """Routes declared in the first _ROUTE_SCAN_BYTES of content (bytes or an mmap)"""
+    endpoints = []
+    # Skip files without a route decorator receiver before running the regex
+    if (content.find(b'@app.', 0, _ROUTE_SCAN_BYTES) < 0
+            and content.find(b'@router.', 0, _ROUTE_SCAN_BYTES) < 0):
+        return endpoints
+    
+    # Flask/FastAPI routes, including @app.route(..., methods=[...])
+    for match in _ROUTE_RE.finditer(content, 0, _ROUTE_SCAN_BYTES):
+        method = match.group('method').upper()
+        if method == b'ROUTE':
+            methods = match.group('methods')
+            methods = _WORD_RE.findall(methods.upper()) if methods else [b'GET']
+        else:
+            methods = [method]
+        for method in methods:
+            endpoints.append({
+                'method': method.decode('ascii'),
+                'path': match.group('path').decode('utf-8', 'replace'),
+                'file': os.path.relpath(file_path, root),
+                'description': 'API endpoint'
+            })
+    return endpoints
+
+
+def _scan_routes(file_path: str, root: str) -> List[Dict]:
+    """Extract the API endpoints declared in one Python file"""
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0 or size > MAX_BYTES:
+                return []
+            if size < _ROUTE_MMAP_BYTES:
+                return _match_routes(f.read(_ROUTE_SCAN_BYTES), file_path, root)
+            # Larger modules are matched in place instead of copied into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _match_routes(mm, file_path, root)
+    except (OSError, ValueError):
+        return []
+
+
+class DocsGenerator:
+    """Generate documentation from code"""
+    
+    COMPONENT_DIRS = frozenset({'src', 'app', 'services', 'api', 'web', 'client', 'server'})
+    
+    def __init__(self, path: str, index: Optional[FileIndex] = None, use_cache: bool = True):
+        self.root_path = Path(path).resolve()
+        self.use_cache = use_cache
+        self.index = index or FileIndex(str(self.root_path))
+        self.generated_files: List[str] = []
+        self._created_dirs: Set[Path] = set()
+    
+    def generate_readme(self, output: Optional[str] = None) -> str:
+        """Generate README.md and return the path written"""
+        print("📝 Generating README.md...")
+        
+        install_steps = self._install_steps
+        
+        content = _README_TEMPLATE.format(
+            title=self.root_path.name.title().replace('-', ' '),
+            quick_start=install_steps or '# Clone and install\ngit clone <repository-url>\nnpm install',
+            description=self._description or 'A brief description of the project goes here.',
+            install_steps=install_steps or '# Add installation steps here',
+            usage=self._usage_examples or '```python\n# Example usage\n# Add your usage examples here\n```',
+        )
+        
+        output_path = self._prepare_output(output, self.root_path / 'README.md')
+        self._write_doc(output_path, [content])
+        return str(output_path)
+    
+    def generate_api_docs(self, output: Optional[str] = None) -> str:
+        """Generate API.md and return the path written"""
+        print("📝 Generating API.md...")
+        
+        endpoints = self._endpoints
+        
+        chunks = [_API_HEADER_TEMPLATE.format(generated=self._generated_at)]
+        if endpoints:
+            for endpoint in endpoints:
+                chunks.append(_ENDPOINT_TEMPLATE.format(
+                    method=endpoint.get('method', 'GET'),
+                    path=endpoint.get('path', '/unknown'),
+                    description=endpoint.get('description', 'API endpoint'),
+                ))
+        else:
+            chunks.append(_NO_ENDPOINTS)
         
-        output_path = output or (self.root_path / 'docs' / 'ARCHITECTURE.md')
-        if isinstance(output_path, str):
-            output_path = Path(output_path)
+        output_path = self._prepare_output(output, self.root_path / 'docs' / 'API.md')
+        self._write_doc(output_path, chunks)
+        return str(output_path)
+    
+    def generate_architecture(self, output: Optional[str] = None) -> str:
+        """Generate ARCHITECTURE.md and return the path written"""
+        print("📝 Generating ARCHITECTURE.md...")
         
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        components = self._components
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        chunks = [_ARCHITECTURE_HEADER_TEMPLATE.format(generated=self._generated_at)]
+        if components:
+            for comp in components:
+                chunks.append(_COMPONENT_TEMPLATE.format(name=comp))
+        else:
+            chunks.append(_NO_COMPONENTS)
+        chunks.append(_ARCHITECTURE_FOOTER)
+        
+        output_path = self._prepare_output(output, self.root_path / 'docs' / 'ARCHITECTURE.md')
+        self._write_doc(output_path, chunks)
+        return str(output_path)
+    
+    def _prepare_output(self, output: Optional[str], default: Path) -> Path:
+        """Resolve the output path and make sure its directory exists"""
+        output_path = Path(output) if output else default
+        parent = output_path.parent
+        # generate_all writes several docs into the same directories; only
+        # the first write to each pays for the mkdir
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+        return output_path
+    
+    def _write_doc(self, output_path: Path, chunks: Iterable[str]):
+        """Stream a generated document to disk as UTF-8, one section at a time"""
+        with open(output_path, 'wb', buffering=1 << 16) as f:
+            for chunk in chunks:
+                f.write(chunk.encode('utf-8'))
         
         self.generated_files.append(str(output_path))
+        self.index.add(str(output_path))
         print(f"✅ Generated: {output_path}")
-        return content
     
-    def _get_description(self) -> str:
+    @functools.cached_property
+    def _generated_at(self) -> str:
+        """Timestamp stamped on every document from this generator, formatted once"""
+        from datetime import datetime
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    @functools.cached_property
+    def _root_entries(self) -> FrozenSet[str]:
+        """Names directly under the project root, listed once per generator"""
+        try:
+            return frozenset(os.listdir(self.root_path))
+        except OSError:
+            return frozenset()
+    
+    @functools.cached_property
+    def _package_json(self) -> Optional[Dict]:
+        """Parsed package.json, or None when missing or unreadable"""
+        if 'package.json' not in self._root_entries:
+            return None
+        import json
+        try:
+            data = json.loads((self.root_path / 'package.json').read_bytes())
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+    
+    @functools.cached_property
+    def _description(self) -> str:
         """Extract project description"""
         # Try package.json
-        pkg_json = self.root_path / 'package.json'
-        if pkg_json.exists():
-            try:
-                with open(pkg_json) as f:
-                    data = json.load(f)
-                    return data.get('description', '')
-            except:
-                pass
+        if self._package_json is not None:
+            return self._package_json.get('description', '')
         
         # Try setup.py
-        setup_py = self.root_path / 'setup.py'
-        if setup_py.exists():
-            try:
-                with open(setup_py, 'r') as f:
-                    content = f.read()
-                    match = re.search(r'description=[\'"]([^\'"]+)[\'"]', content)
-                    if match:
-                        return match.group(1)
-            except:
-                pass
-        
-        return ''
+        return self._setup_description
+    
+    @functools.cached_property
+    def _setup_description(self) -> str:
+        """description= from the setup() call in setup.py, parsed once
+        
+        Only a literal string is taken from the AST, so implicitly
+        concatenated and multi-line descriptions come through whole. When
+        setup.py does not parse, or builds its description some other way,
+        the first description='...' in the file is used instead.
+        """
+        if 'setup.py' not in self._root_entries:
+            return ''
+        try:
+            source = read_bytes(str(self.root_path / 'setup.py'))
+            tree = ast.parse(source)
+        except OSError:
+            return ''
+        except (SyntaxError, ValueError):
+            tree = None
+        
+        for node in ast.walk(tree) if tree is not None else ():
+            if not isinstance(node, ast.Call):
+                continue
+            func = node.func
+            name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', '')
+            if name != 'setup':
+                continue
+            for keyword in node.keywords:
+                if (keyword.arg == 'description'
+                        and isinstance(keyword.value, ast.Constant)
+                        and isinstance(keyword.value.value, str)):
+                    return keyword.value.value
+        
+        match = _SETUP_DESCRIPTION_RE.search(source)
+        return match.group(1).decode('utf-8', 'replace') if match else ''
     
-    def _get_install_steps(self) -> str:
+    @functools.cached_property
+    def _install_steps(self) -> str:
         """Detect installation steps"""
         steps = []
+        entries = self._root_entries
         
-        if (self.root_path / 'package.json').exists():
+        if 'package.json' in entries:
             steps.append('npm install')
         
-        if (self.root_path / 'requirements.txt').exists():
+        if 'requirements.txt' in entries:
             steps.append('pip install -r requirements.txt')
         
-        if (self.root_path / 'Cargo.toml').exists():
+        if 'Cargo.toml' in entries:
             steps.append('cargo build')
         
-        if (self.root_path / 'go.mod').exists():
+        if 'go.mod' in entries:
             steps.append('go mod download')
         
         return '\n'.join(steps)
     
-    def _get_usage_examples(self) -> str:
+    @functools.cached_property
+    def _usage_examples(self) -> str:
         """Find usage examples"""
-        examples_dir = self.root_path / 'examples'
-        if examples_dir.exists():
-            for file_path in examples_dir.glob('*'):
-                if file_path.is_file():
-                    try:
-                        with open(file_path, 'r') as f:
-                            content = f.read(1000)
-                            return f"```{file_path.suffix[1:]}\n{content}\n```"
-                    except:
-                        pass
+        if 'examples' not in self._root_entries:
+            return ''
+        try:
+            entries = os.scandir(self.root_path / 'examples')
+        except OSError:
+            return ''
+        with entries:
+            for entry in entries:
+                # DirEntry caches the type from the listing, so no extra stat
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    with open(entry.path, 'rb') as f:
+                        # A character cut at the 1000-byte mark is dropped, not mangled
+                        content = f.read(1000).decode('utf-8', 'ignore')
+                except OSError:
+                    continue
+                suffix = os.path.splitext(entry.name)[1][1:]
+                return f"```{suffix}\n{content}\n```"
         return ''
     
-    def _extract_api_endpoints(self) -> List[Dict]:
-        """Extract API endpoints from code"""
-        endpoints = []
+    @functools.cached_property
+    def _endpoints(self) -> List[Dict]:
+        """API endpoints found in the code, extracted once per generator
+        
+        Results are kept in .docs_cache/endpoints.json under the project,
+        keyed by the path, size and mtime of every scanned module, so a rerun
+        on an unchanged tree skips the scan entirely.
+        """
+        if not self.use_cache:
+            return self._extract_api_endpoints()
+        
+        import json
+        cache_path = self.root_path / _CACHE_DIR / 'endpoints.json'
+        state = self._source_state()
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if cached['hash'] == state and time.time() - cached['created'] < _CACHE_TTL:
+                return cached['endpoints']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
         
-        for file_path in self.root_path.rglob('*.py'):
+        endpoints = self._extract_api_endpoints()
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            cache_path.write_text(json.dumps({'hash': state, 'created': time.time(), 'endpoints': endpoints}),
+                                  encoding='utf-8')
+        except OSError:
+            pass
+        return endpoints
+    
+    def _source_state(self) -> str:
+        """Fingerprint of the modules the route scan reads"""
+        digest = hashlib.blake2b(_CACHE_VERSION)
+        for path in self.index.py_files[:_ROUTE_SCAN_FILES]:
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    
-                    # Flask/FastAPI routes
-                    for match in re.finditer(r'@(?:app|router)\.(get|post|put|delete|patch)\([\'"]([^\'"]+)[\'"]', content, re.IGNORECASE):
-                        endpoints.append({
-                            'method': match.group(1).upper(),
-                            'path': match.group(2),
-                            'file': str(file_path.relative_to(self.root_path)),
-                            'description': 'API endpoint'
-                        })
-            except:
-                pass
+                st = os.stat(path)
+            except OSError:
+                continue
+            digest.update(struct.pack('<qq', st.st_mtime_ns, st.st_size))
+            digest.update(os.fsencode(path))
+        return digest.hexdigest()
+    
+    def _extract_api_endpoints(self, limit: int = 20) -> List[Dict]:
+        """Extract API endpoints from code"""
+        endpoints = []
         
-        return endpoints[:20]
+        # Files are scanned concurrently; map() keeps results in file order.
+        # Stop as soon as the limit is reached instead of scanning everything.
+        scan = functools.partial(_scan_routes, root=str(self.root_path))
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for found in executor.map(scan, self.index.py_files[:_ROUTE_SCAN_FILES]):
+                endpoints.extend(found)
+                if len(endpoints) >= limit:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+        
+        return endpoints[:limit]
     
-    def _detect_components(self) -> List[str]:
+    @functools.cached_property
+    def _components(self) -> List[str]:
         """Detect system components from directory structure"""
         components = []
         
-        for dir_path in self.root_path.iterdir():
-            if dir_path.is_dir() and not dir_path.name.startswith('.'):
-                if dir_path.name in ['src', 'app', 'services', 'api', 'web', 'client', 'server']:
-                    components.append(dir_path.name.title())
+        # Test the name first so only candidate entries pay for is_dir()
+        with os.scandir(self.root_path) as entries:
+            for entry in entries:
+                if entry.name in self.COMPONENT_DIRS and entry.is_dir():
+                    components.append(entry.name.title())
         
         return components if components else ['API', 'Service', 'Database']
     
@@ -358,10 +546,11 @@ def main():
     parser.add_argument('--path', '-p', default='.', help='Path to project')
     parser.add_argument('--output', '-o', help='Output directory')
     parser.add_argument('--type', '-t', choices=['readme', 'api', 'architecture', 'all'], default='all')
+    parser.add_argument('--no-cache', action='store_true', help='Rescan sources instead of using .docs_cache')
     
     args = parser.parse_args()
     
-    generator = DocsGenerator(args.path)
+    generator = DocsGenerator(args.path, use_cache=not args.no_cache)
     
     if args.type == 'readme':
         generator.generate_readme()
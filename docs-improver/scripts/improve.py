@@ -5,8 +5,14 @@ Provides actionable improvement suggestions.
 """
 
 import os
+import re
+import functools
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
+
+
+_README_KEYWORDS = (b'install', b'usage', b'example', b'```', b'contribut')
+_README_KEYWORDS_RE = re.compile(b'|'.join(map(re.escape, _README_KEYWORDS)), re.IGNORECASE)
 
 
 class DocsImprover:
@@ -20,6 +26,25 @@ class DocsImprover:
             'long_term': []
         }
     
+    @functools.cached_property
+    def _root_names(self) -> FrozenSet[str]:
+        """Names directly under the project root, listed once"""
+        return self._list_names(self.root_path)
+    
+    @functools.cached_property
+    def _docs_names(self) -> FrozenSet[str]:
+        """Names directly under docs/, listed once"""
+        if 'docs' not in self._root_names:
+            return frozenset()
+        return self._list_names(self.root_path / 'docs')
+    
+    @staticmethod
+    def _list_names(path: Path) -> FrozenSet[str]:
+        try:
+            return frozenset(os.listdir(path))
+        except OSError:
+            return frozenset()
+    
     def analyze_and_suggest(self) -> Dict[str, List[str]]:
         """Analyze and provide recommendations"""
         print("💡 Analyzing documentation for improvements...")
@@ -34,37 +59,42 @@ class DocsImprover:
         """Check README quality"""
         readme = self.root_path / 'README.md'
         
-        if not readme.exists():
+        if 'README.md' not in self._root_names:
             self.recommendations['quick_wins'].append('Create README.md with project overview')
             return
         
-        with open(readme, 'r') as f:
-            content = f.read().lower()
+        with open(readme, 'rb') as f:
+            content = f.read()
+        
+        # One case-insensitive pass collects every keyword present
+        found = set()
+        for match in _README_KEYWORDS_RE.finditer(content):
+            found.add(match.group(0).lower())
+            if len(found) == len(_README_KEYWORDS):
+                break
         
-        if 'install' not in content:
+        if b'install' not in found:
             self.recommendations['quick_wins'].append('Add installation instructions')
         
-        if 'usage' not in content and 'example' not in content:
+        if b'usage' not in found and b'example' not in found:
             self.recommendations['quick_wins'].append('Add usage examples')
         
-        if '```' not in content:
+        if b'```' not in found:
             self.recommendations['quick_wins'].append('Add code examples')
         
-        if 'contribut' not in content:
+        if b'contribut' not in found:
             self.recommendations['short_term'].append('Add contributing guidelines')
     
     def _check_examples(self):
         """Check example quality"""
         examples_dir = self.root_path / 'examples'
         
-        if not examples_dir.exists() or not any(examples_dir.iterdir()):
+        if 'examples' not in self._root_names or not any(examples_dir.iterdir()):
             self.recommendations['short_term'].append('Add examples directory with working examples')
     
     def _check_structure(self):
         """Check documentation structure"""
-        docs_dir = self.root_path / 'docs'
-        
-        if not docs_dir.exists():
+        if 'docs' not in self._root_names:
             self.recommendations['short_term'].append('Create docs/ directory for detailed documentation')
         
         required_docs = {
@@ -74,7 +104,7 @@ class DocsImprover:
         }
         
         for doc, desc in required_docs.items():
-            if not (docs_dir / doc).exists() and not (self.root_path / doc).exists():
+            if doc not in self._docs_names and doc not in self._root_names:
                 self.recommendations['long_term'].append(f'Create {desc}')
     
     def export_plan(self, output_path: str):
@@ -95,7 +125,7 @@ class DocsImprover:
             md.append(f"- [ ] {rec}")
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(md))
+            f.writelines(line + '\n' for line in md)
         
         print(f"✅ Plan saved to: {output_path}")
 
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Documentation Data Models
+Report and issue records shared by the docs-improver scripts.
+"""
+
+from typing import Dict, List
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class QualityIssue:
+    """Problem found while scoring documentation quality"""
+    severity: str
+    type: str
+    description: str
+    fix: str
+
+
+@dataclass(slots=True)
+class QualityReport:
+    """Documentation quality report"""
+    overall_score: int = 0
+    completeness_score: int = 0
+    accuracy_score: int = 0
+    clarity_score: int = 0
+    structure_score: int = 0
+    maintainability_score: int = 0
+    
+    files_analyzed: List[Dict] = field(default_factory=list)
+    issues: List[QualityIssue] = field(default_factory=list)
+    quick_wins: List[str] = field(default_factory=list)
+    short_term: List[str] = field(default_factory=list)
+    long_term: List[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ConsistencyIssue:
+    """Consistency issue"""
+    type: str
+    severity: str
+    location: str
+    description: str
+    expected: str
+    actual: str
+    fix_suggestion: str
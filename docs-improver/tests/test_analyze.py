@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for the documentation quality analyzer
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from analyze import DocsAnalyzer
+
+
+class ExtractFeaturesTest(unittest.TestCase):
+    """Feature scan of a single document"""
+
+    def setUp(self):
+        self.analyzer = DocsAnalyzer('.')
+
+    def test_install_keyword_inside_fence_counts(self):
+        content = "# Project\n\n```bash\npip install x\n```\n"
+        features = self.analyzer._extract_features(content)
+        self.assertEqual(features['install'], 1)
+        self.assertTrue(features['balanced_fences'])
+
+    def test_fenced_install_scores_installation(self):
+        content = "# Project\n\n```bash\npip install x\n```\n"
+        features = self.analyzer._extract_features(content)
+        with_install = self.analyzer._check_completeness(content, 'README.md', features)
+        bare = "# Project\n\n```bash\npip x\n```\n"
+        without_install = self.analyzer._check_completeness(
+            bare, 'README.md', self.analyzer._extract_features(bare))
+        self.assertGreater(with_install, without_install)
+
+    def test_shell_comment_inside_fence_is_not_a_heading(self):
+        content = "```bash\n# not a heading\n```\n"
+        features = self.analyzer._extract_features(content)
+        self.assertEqual(sum(features['headings']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,18 +4,122 @@ Java Code Review - Automatic code review tool for Java projects
 """
 
 import argparse
+import functools
+import hashlib
+import multiprocessing
 import re
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
 
 
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 32
+# Per-file results are cached per user, one file per reviewed project, so
+# nothing is written into the project itself; bump the version whenever a
+# check changes so results from older rules are not reused
+_CACHE_VERSION = 1
+
+# Patterns used by the checks, compiled once instead of on every line
+_CLASS_RE = re.compile(r'public\s+class\s+(\w+)')
+_METHOD_CAMEL_RE = re.compile(r'\b(public|private|protected)\s+\w+\s+[a-z]\w*\s*\(')
+_METHOD_PASCAL_RE = re.compile(r'\b(public|private|protected)\s+\w+\s+[A-Z]\w*\s*\(')
+_METHOD_SIG_RE = re.compile(r'(public|private|protected).*?\s+(\w+)\s*\([^)]*\)\s*\{')
+_PARAM_RE = re.compile(r'\w+\s*\(([^)]+)\)')
+_BRACE_RE = re.compile(r'[{}]')
+# A quoted SQL verb, a '+' after it, and a quote after that. Taking the first
+# '+' and the last quote keeps the search linear on long lines, where the
+# two lazy .*? runs used to backtrack over every '+' in turn.
+_SQL_INJECTION_RE = re.compile(r'["\'](?:SELECT|INSERT|UPDATE|DELETE)[^+]*\+.*["\']', re.IGNORECASE)
+_PASSWORD_RE = re.compile(r'(password|passwd|pwd|secret)\s*[=:]\s*["\'][^"\']+["\']', re.IGNORECASE)
+_XSS_RE = re.compile(r'\.getParameter\([^)]+\)|request\([^)]+\)')
+_LOOP_QUERY_RE = re.compile(
+    r'for\s*\([^)]+\)\s*\{[^}]*\.find\([^)]*\)|for\s*\([^)]+\)\s*\{[^}]*\.get\([^)]*\)',
+    re.IGNORECASE)
+_RESOURCE_RE = re.compile(
+    r'(new\s+FileInputStream|new\s+FileOutputStream|new\s+BufferedReader|new\s+InputStreamReader)\s*\(')
+_UNSAFE_COLL_RE = re.compile(r'(HashMap|ArrayList|HashSet)\s*<[^>]+>\s+\w+\s*=')
+_SYNC_RE = re.compile(r'public\s+synchronized\s+\w+')
+# 'String' and '+=' anywhere on the same line, as a pattern
+_STRING_CONCAT_RE = re.compile(r'String.*\+=|\+=.*String')
+# Any of the per-line rules in one alternation, so a line none of them can
+# match costs a single search; inline flags keep each rule's case handling
+_LINE_RULES_RE = re.compile('|'.join(
+    f'(?i:{rule.pattern})' if rule.flags & re.IGNORECASE else f'(?:{rule.pattern})'
+    for rule in (_METHOD_PASCAL_RE, _SQL_INJECTION_RE, _PASSWORD_RE, _XSS_RE, _LOOP_QUERY_RE,
+                 _RESOURCE_RE, _STRING_CONCAT_RE, _UNSAFE_COLL_RE, _SYNC_RE)
+))
+
+
+def _review_file_worker(file_path: str, root: str) -> tuple:
+    """Review one file in a worker process and return its (issues, stats)"""
+    reviewer = JavaCodeReviewer(root)
+    reviewer._review_file(file_path)
+    return reviewer.issues, reviewer.stats
+
+
+def _iter_java_files(root: str):
+    """Yield the .java files under root, in the same order as Path.rglob('*.java')
+    
+    Directories are walked depth-first with os.scandir, whose entries carry
+    their type, so nothing is stat'ed twice. Symlinked directories are not
+    followed. Paths come back as plain strings, spelled as rglob spells them.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # rglob drops the leading './' when walking the current directory
+                    path = entry.name if directory == os.curdir else entry.path
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(path)
+                    elif entry.name.endswith('.java') and entry.is_file():
+                        yield path
+        except OSError:
+            continue
+        # Reversed, so the first subdirectory is popped (and walked) first
+        stack.extend(reversed(subdirs))
+
+
+def _file_state(file_path: str):
+    """[mtime_ns, size] of a file for the results cache, or None if it cannot be stat'ed"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _match_braces(content: str, pos: int = 0) -> dict:
+    """Map the offset of every '{' from pos on to the offset of its matching '}', in one pass
+    
+    A '}' closing a brace opened before pos is skipped, so the pairs found
+    are the same as for a scan of the whole content.
+    """
+    closing = {}
+    opened = []
+    push, pop = opened.append, opened.pop
+    for match in _BRACE_RE.finditer(content, pos):
+        i = match.start()
+        if content[i] == '{':
+            push(i)
+        elif opened:
+            closing[pop()] = i
+    return closing
+
+
 class JavaCodeReviewer:
     """Java code review engine"""
     
-    def __init__(self, path: str):
+    def __init__(self, path: str, use_cache: bool = True):
         self.root_path = Path(path)
+        self.use_cache = use_cache
         self.issues = defaultdict(list)
         self.stats = {
             'files': 0,
@@ -25,87 +129,145 @@ class JavaCodeReviewer:
         }
     
     def scan(self) -> list:
-        """Scan Java files"""
+        """Scan Java files
+        
+        Per-file results are kept in the user's cache directory (see
+        _cache_path), keyed by each file's mtime and size, so a rerun only
+        reviews the files that changed since the last one.
+        """
         print(f"🔍 扫描 Java 项目：{self.root_path}")
         
-        java_files = list(self.root_path.rglob('*.java'))
+        java_files = list(_iter_java_files(str(self.root_path)))
         print(f"  找到 {len(java_files)} 个 Java 文件")
         
+        cache = self._load_cache() if self.use_cache else {}
+        results = {}
+        states = {}
+        todo = []
         for file_path in java_files:
-            self._review_file(file_path)
+            key = file_path
+            states[key] = _file_state(file_path)
+            entry = cache.get(key)
+            if entry is not None and states[key] is not None and entry['state'] == states[key]:
+                results[key] = (entry['issues'], entry['stats'])
+            else:
+                todo.append(file_path)
+        
+        # The checks are CPU-bound and independent per file, so larger trees
+        # are spread over one process per core; map() keeps the file order
+        worker = functools.partial(_review_file_worker, root=str(self.root_path))
+        if len(todo) < _PARALLEL_MIN_FILES or (os.cpu_count() or 1) < 2:
+            reviewed = list(map(worker, todo))
+        else:
+            # Forked workers inherit the compiled patterns and loaded module
+            # instead of re-importing it; elsewhere the platform default stays
+            mp_context = multiprocessing.get_context('fork') if sys.platform == 'linux' else None
+            with ProcessPoolExecutor(mp_context=mp_context) as executor:
+                reviewed = list(executor.map(worker, todo, chunksize=16))
+        results.update(zip(todo, reviewed))
+        
+        for file_path in java_files:
+            issues, stats = results[file_path]
+            for severity, found in issues.items():
+                self.issues[severity].extend(found)
+            for key, value in stats.items():
+                self.stats[key] += value
+        
+        if self.use_cache:
+            # Files that could not be read are left out so they are retried
+            self._save_cache({
+                key: {'state': states[key], 'issues': issues, 'stats': stats}
+                for key, (issues, stats) in results.items()
+                if states[key] is not None and stats['files']
+            })
         
         return java_files
     
-    def _review_file(self, file_path: Path):
+    def _cache_path(self) -> Path:
+        """$XDG_CACHE_HOME/java-review/<hash of the resolved project path>.json
+        
+        Falls back to ~/.cache when XDG_CACHE_HOME is not set.
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        digest = hashlib.sha256(str(self.root_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        return Path(cache_home) / 'java-review' / f'{digest}.json'
+    
+    def _load_cache(self) -> dict:
+        """Per-file results from the last run, or {} when missing or from another version"""
+        import json
+        try:
+            cached = json.loads(self._cache_path().read_bytes())
+            if cached['version'] == _CACHE_VERSION:
+                return cached['files']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+    
+    def _save_cache(self, files: dict):
+        """Replace the cached results with those of this run"""
+        import json
+        try:
+            cache_path = self._cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({'version': _CACHE_VERSION, 'files': files}, ensure_ascii=False),
+                                  encoding='utf-8')
+        except OSError:
+            pass
+    
+    def _review_file(self, file_path: str):
         """Review a single Java file"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
+            # One raw read and one decode, skipping the text layer; newlines
+            # are normalized the way text mode would, but only when needed
+            with open(file_path, 'rb') as f:
+                content = f.read().decode('utf-8', 'ignore')
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            lines = content.split('\n')
             
             self.stats['files'] += 1
             self.stats['lines'] += len(lines)
             
-            # Run all checks
-            self._check_naming(file_path, content, lines)
+            # Run all checks; the per-line ones share a single pass
+            self._check_naming(file_path, content)
             self._check_code_smell(file_path, content, lines)
-            self._check_security(file_path, content, lines)
-            self._check_performance(file_path, content, lines)
-            self._check_concurrency(file_path, content, lines)
+            self._check_lines(file_path, lines)
             
         except Exception as e:
             print(f"  ⚠️ 读取失败 {file_path}: {e}")
     
-    def _check_naming(self, file_path: Path, content: str, lines: list):
-        """Check naming conventions"""
-        filename = file_path.name
+    def _check_naming(self, file_path: str, content: str):
+        """Check that the public class is named after its file"""
+        filename = os.path.basename(file_path)
         
         # Class name should match filename
-        class_match = re.search(r'public\s+class\s+(\w+)', content)
+        class_match = _CLASS_RE.search(content)
         if class_match:
             class_name = class_match.group(1)
             if class_name != filename.replace('.java', ''):
                 self.issues['major'].append({
                     'type': '命名规范',
-                    'location': str(file_path),
+                    'location': file_path,
                     'description': f'类名 {class_name} 与文件名不匹配',
                     'suggestion': '类名应与文件名保持一致'
                 })
-        
-        # Check method names (should be camelCase)
-        for i, line in enumerate(lines, 1):
-            if re.search(r'\b(public|private|protected)\s+\w+\s+[a-z]\w*\s*\(', line):
-                # Good - camelCase
-                pass
-            elif re.search(r'\b(public|private|protected)\s+\w+\s+[A-Z]\w*\s*\(', line):
-                self.issues['minor'].append({
-                    'type': '命名规范',
-                    'location': f'{file_path}:{i}',
-                    'description': '方法名应使用 camelCase',
-                    'line': line.strip()
-                })
     
-    def _check_code_smell(self, file_path: Path, content: str, lines: list):
+    def _check_code_smell(self, file_path: str, content: str, lines: list):
         """Check code smells"""
-        # Check method length
-        method_pattern = r'(public|private|protected).*?\s+(\w+)\s*\([^)]*\)\s*\{'
-        for match in re.finditer(method_pattern, content):
+        # Check method length; braces are paired once, from the first
+        # method's opening brace on, and only if there is a method at all
+        closing = None
+        for match in _METHOD_SIG_RE.finditer(content):
             method_name = match.group(2)
             start = match.end()
+            if closing is None:
+                closing = _match_braces(content, start - 1)
             
-            # Count braces to find method end
-            brace_count = 1
-            end = start
-            for i in range(start, len(content)):
-                if content[i] == '{':
-                    brace_count += 1
-                elif content[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end = i
-                        break
+            # The signature ends with the method's opening brace; an
+            # unbalanced one counts as an empty body
+            end = closing.get(start - 1, start)
             
-            method_lines = content[start:end].count('\n')
+            method_lines = content.count('\n', start, end)
             if method_lines > 50:
                 self.issues['major'].append({
                     'type': '代码异味',
@@ -118,14 +280,13 @@ class JavaCodeReviewer:
         if len(lines) > 500:
             self.issues['major'].append({
                 'type': '代码异味',
-                'location': str(file_path),
+                'location': file_path,
                 'description': f'类过大 ({len(lines)}行)',
                 'suggestion': '按职责拆分（建议<500 行）'
             })
         
         # Check parameter count
-        param_pattern = r'\w+\s*\(([^)]+)\)'
-        for match in re.finditer(param_pattern, content):
+        for match in _PARAM_RE.finditer(content):
             params = match.group(1).split(',')
             if len(params) > 5 and 'class' not in match.group(0):
                 self.issues['minor'].append({
@@ -135,110 +296,101 @@ class JavaCodeReviewer:
                     'suggestion': '使用参数对象或 Builder 模式'
                 })
     
-    def _check_security(self, file_path: Path, content: str, lines: list):
-        """Check security vulnerabilities"""
-        # SQL Injection
-        sql_pattern = r'["\']SELECT.*?\+.*?["\']|["\']INSERT.*?\+.*?["\']|["\']UPDATE.*?\+.*?["\']|["\']DELETE.*?\+.*?["\']'
+    def _check_lines(self, file_path: str, lines: list):
+        """Run the naming, security, performance and concurrency checks in one pass over the lines"""
         for i, line in enumerate(lines, 1):
-            if re.search(sql_pattern, line, re.IGNORECASE):
+            # Most lines match no rule at all, so rule them out with one search
+            if not _LINE_RULES_RE.search(line):
+                continue
+            location = f'{file_path}:{i}'
+            
+            # Method names should be camelCase
+            if not _METHOD_CAMEL_RE.search(line) and _METHOD_PASCAL_RE.search(line):
+                self.issues['minor'].append({
+                    'type': '命名规范',
+                    'location': location,
+                    'description': '方法名应使用 camelCase',
+                    'line': line.strip()
+                })
+            
+            # SQL Injection
+            if _SQL_INJECTION_RE.search(line):
                 self.issues['critical'].append({
                     'type': '安全',
-                    'location': f'{file_path}:{i}',
+                    'location': location,
                     'description': 'SQL 注入风险 - 字符串拼接 SQL',
                     'line': line.strip(),
                     'suggestion': '使用 PreparedStatement 或参数化查询'
                 })
-        
-        # Hardcoded passwords
-        password_pattern = r'(password|passwd|pwd|secret)\s*[=:]\s*["\'][^"\']+["\']'
-        for i, line in enumerate(lines, 1):
-            if re.search(password_pattern, line, re.IGNORECASE):
+            
+            # Hardcoded passwords
+            if _PASSWORD_RE.search(line):
                 self.issues['critical'].append({
                     'type': '安全',
-                    'location': f'{file_path}:{i}',
+                    'location': location,
                     'description': '硬编码密码/密钥',
                     'line': line.strip(),
                     'suggestion': '使用环境变量或配置中心'
                 })
-        
-        # XSS - unescaped user input
-        xss_pattern = r'\.getParameter\([^)]+\)|request\([^)]+\)'
-        for i, line in enumerate(lines, 1):
-            if re.search(xss_pattern, line):
-                if 'escape' not in line and 'encode' not in line:
-                    self.issues['major'].append({
-                        'type': '安全',
-                        'location': f'{file_path}:{i}',
-                        'description': '潜在的 XSS 风险 - 用户输入未转义',
-                        'line': line.strip(),
-                        'suggestion': '对用户输入进行 HTML 转义'
-                    })
-    
-    def _check_performance(self, file_path: Path, content: str, lines: list):
-        """Check performance issues"""
-        # N+1 query in loop
-        loop_pattern = r'for\s*\([^)]+\)\s*\{[^}]*\.find\([^)]*\)|for\s*\([^)]+\)\s*\{[^}]*\.get\([^)]*\)'
-        for i, line in enumerate(lines, 1):
-            if re.search(loop_pattern, line, re.IGNORECASE):
+            
+            # XSS - unescaped user input
+            if _XSS_RE.search(line) and 'escape' not in line and 'encode' not in line:
+                self.issues['major'].append({
+                    'type': '安全',
+                    'location': location,
+                    'description': '潜在的 XSS 风险 - 用户输入未转义',
+                    'line': line.strip(),
+                    'suggestion': '对用户输入进行 HTML 转义'
+                })
+            
+            # N+1 query in loop
+            if _LOOP_QUERY_RE.search(line):
                 self.issues['major'].append({
                     'type': '性能',
-                    'location': f'{file_path}:{i}',
+                    'location': location,
                     'description': 'N+1 查询风险 - 循环中查询数据库',
                     'line': line.strip(),
                     'suggestion': '使用批量查询或 JOIN'
                 })
-        
-        # Resource not closed
-        resource_pattern = r'(new\s+FileInputStream|new\s+FileOutputStream|new\s+BufferedReader|new\s+InputStreamReader)\s*\('
-        for i, line in enumerate(lines, 1):
-            if re.search(resource_pattern, line):
+            
+            # Resource not closed
+            if _RESOURCE_RE.search(line):
                 # Check if in try-with-resources
-                context_start = max(0, i - 5)
-                context = '\n'.join(lines[context_start:i])
+                context = '\n'.join(lines[max(0, i - 5):i])
                 if 'try (' not in context and 'try(' not in context:
                     self.issues['major'].append({
                         'type': '性能',
-                        'location': f'{file_path}:{i}',
+                        'location': location,
                         'description': '资源未关闭 - 可能导致内存泄漏',
                         'line': line.strip(),
                         'suggestion': '使用 try-with-resources'
                     })
-        
-        # String concatenation in loop
-        concat_pattern = r'for\s*\([^)]+\)\s*\{[^}]*\+=[^}]*\}'
-        for i, line in enumerate(lines, 1):
+            
+            # String concatenation in loop
             if 'String' in line and '+=' in line:
                 self.issues['minor'].append({
                     'type': '性能',
-                    'location': f'{file_path}:{i}',
+                    'location': location,
                     'description': '字符串拼接性能问题',
                     'line': line.strip(),
                     'suggestion': '使用 StringBuilder'
                 })
-    
-    def _check_concurrency(self, file_path: Path, content: str, lines: list):
-        """Check concurrency issues"""
-        # Non-thread-safe collection
-        unsafe_pattern = r'(HashMap|ArrayList|HashSet)\s*<[^>]+>\s+\w+\s*='
-        for i, line in enumerate(lines, 1):
-            if re.search(unsafe_pattern, line):
-                # Check if it's static or shared
-                if 'static' in line or 'public' in line:
-                    self.issues['major'].append({
-                        'type': '并发',
-                        'location': f'{file_path}:{i}',
-                        'description': '线程安全问题 - 使用非线程安全集合',
-                        'line': line.strip(),
-                        'suggestion': '使用 ConcurrentHashMap/CopyOnWriteArrayList'
-                    })
-        
-        # Synchronized method (potential performance issue)
-        sync_pattern = r'public\s+synchronized\s+\w+'
-        for i, line in enumerate(lines, 1):
-            if re.search(sync_pattern, line):
+            
+            # Non-thread-safe collection, if it's static or shared
+            if _UNSAFE_COLL_RE.search(line) and ('static' in line or 'public' in line):
+                self.issues['major'].append({
+                    'type': '并发',
+                    'location': location,
+                    'description': '线程安全问题 - 使用非线程安全集合',
+                    'line': line.strip(),
+                    'suggestion': '使用 ConcurrentHashMap/CopyOnWriteArrayList'
+                })
+            
+            # Synchronized method (potential performance issue)
+            if _SYNC_RE.search(line):
                 self.issues['minor'].append({
                     'type': '并发',
-                    'location': f'{file_path}:{i}',
+                    'location': location,
                     'description': '同步方法 - 可能影响性能',
                     'line': line.strip(),
                     'suggestion': '考虑使用更细粒度的锁或无锁设计'
@@ -255,7 +407,7 @@ class JavaCodeReviewer:
         score -= len(self.issues['minor']) * 2
         score = max(0, min(100, score))
         
-        report = f"""# Java 代码审查报告
+        parts = [f"""# Java 代码审查报告
 
 **审查时间:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
 **审查路径:** {self.root_path}  
@@ -274,45 +426,45 @@ class JavaCodeReviewer:
 
 ---
 
-"""
+"""]
         
         if self.issues['critical']:
-            report += "## 🔴 严重问题 ({})\n\n".format(len(self.issues['critical']))
+            parts.append("## 🔴 严重问题 ({})\n\n".format(len(self.issues['critical'])))
             for i, issue in enumerate(self.issues['critical'][:10], 1):
-                report += f"### {i}. [{issue['type']}] {issue['description']}\n"
-                report += f"**位置:** `{issue['location']}`\n"
+                parts.append(f"### {i}. [{issue['type']}] {issue['description']}\n")
+                parts.append(f"**位置:** `{issue['location']}`\n")
                 if 'line' in issue:
-                    report += f"**代码:**\n```java\n{issue['line']}\n```\n"
+                    parts.append(f"**代码:**\n```java\n{issue['line']}\n```\n")
                 if 'suggestion' in issue:
-                    report += f"**建议:** {issue['suggestion']}\n"
-                report += "\n"
+                    parts.append(f"**建议:** {issue['suggestion']}\n")
+                parts.append("\n")
         
         if self.issues['major']:
-            report += "## 🟡 主要问题 ({})\n\n".format(len(self.issues['major']))
+            parts.append("## 🟡 主要问题 ({})\n\n".format(len(self.issues['major'])))
             for i, issue in enumerate(self.issues['major'][:10], 1):
-                report += f"### {i}. [{issue['type']}] {issue['description']}\n"
-                report += f"**位置:** `{issue['location']}`\n"
+                parts.append(f"### {i}. [{issue['type']}] {issue['description']}\n")
+                parts.append(f"**位置:** `{issue['location']}`\n")
                 if 'suggestion' in issue:
-                    report += f"**建议:** {issue['suggestion']}\n"
-                report += "\n"
+                    parts.append(f"**建议:** {issue['suggestion']}\n")
+                parts.append("\n")
         
         if self.issues['minor']:
-            report += "## 🟢 次要问题 ({})\n\n".format(len(self.issues['minor']))
+            parts.append("## 🟢 次要问题 ({})\n\n".format(len(self.issues['minor'])))
             for i, issue in enumerate(self.issues['minor'][:10], 1):
-                report += f"{i}. **[{issue['type']}]** {issue['description']} - `{issue['location']}`\n"
+                parts.append(f"{i}. **[{issue['type']}]** {issue['description']} - `{issue['location']}`\n")
         
-        report += f"""
+        parts.append(f"""
 ---
 
 ## 📋 改进建议
 
 ### 立即修复
-"""
+""")
         if self.issues['critical']:
-            report += "- [ ] 修复所有严重安全问题\n"
-            report += "- [ ] 修复资源泄漏问题\n"
+            parts.append("- [ ] 修复所有严重安全问题\n")
+            parts.append("- [ ] 修复资源泄漏问题\n")
         
-        report += """
+        parts.append("""
 ### 短期优化
 - [ ] 重构过长的方法
 - [ ] 优化性能问题
@@ -322,11 +474,12 @@ class JavaCodeReviewer:
 - [ ] 引入代码审查 checklist
 - [ ] 配置 CI 自动检查
 - [ ] 建立代码规范文档
-"""
+""")
         
+        # One join and one encode, then a single unbuffered bytes write;
+        # cheaper than feeding each part through the text layer
         output_path = Path(output)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        output_path.write_bytes(''.join(parts).encode('utf-8'))
         
         print(f"✅ 审查报告已生成：{output_path}")
         print(f"📊 总体评分：{score}/100")
@@ -339,10 +492,11 @@ def main():
     parser.add_argument('--output', '-o', default='代码审查报告.md', help='Output file')
     parser.add_argument('--check', '-c', choices=['all', 'security', 'performance', 'naming'], 
                        default='all', help='Check type')
+    parser.add_argument('--no-cache', action='store_true', help='Review every file instead of using cached results')
     
     args = parser.parse_args()
     
-    reviewer = JavaCodeReviewer(args.path)
+    reviewer = JavaCodeReviewer(args.path, use_cache=not args.no_cache)
     reviewer.scan()
     reviewer.generate_report(args.output)
 
@@ -14,322 +14,355 @@ PPT Generator v2.0 - Generate beautiful HTML presentations
 """
 
 import argparse
-import json
+import functools
 import html
+import re
 from pathlib import Path
-from datetime import datetime
 
 
+# 模板中的占位符，生成时一次扫描全部替换
+_PLACEHOLDERS = (
+    '{{TITLE}}',
+    '{{TOTAL_SLIDES}}',
+    '{{STYLE_CLASS}}',
+    '<!-- SLIDES_PLACEHOLDER -->',
+    '/* THEME_CSS_PLACEHOLDER */',
+    '/* NOTES_JSON_PLACEHOLDER */',
+)
+_PLACEHOLDER_RE = re.compile('|'.join(map(re.escape, _PLACEHOLDERS)))
+
+
+@functools.lru_cache(maxsize=8)
 def load_template(template_path: str) -> str:
-    """加载 HTML 模板"""
+    """加载 HTML 模板（按路径缓存，批量生成时只读一次）"""
     with open(template_path, 'r', encoding='utf-8') as f:
         return f.read()
 
 
-def escape_html(text: str) -> str:
-    """转义 HTML 特殊字符，但保留已有的 HTML 标签"""
+def escape_html(text) -> str:
+    """转义 HTML 特殊字符，但保留已有的 HTML 标签（非字符串值先转为字符串）"""
+    if not isinstance(text, str):
+        text = str(text)
     if '<' in text and '>' in text:
         return text
     return html.escape(text)
 
 
-def generate_slides(content: list) -> tuple[str, list]:
-    """生成幻灯片 HTML，返回 (slides_html, notes_list)"""
-    slides_html = []
-    notes_list = []
-    
-    for i, slide in enumerate(content, 1):
-        slide_type = slide.get('type', 'default')
-        notes = slide.get('notes', '')
-        notes_list.append(notes)
-        
-        fragments = slide.get('fragments', False)
-        fragment_class = ' fragment' if fragments else ''
-        
-        if slide_type == 'title':
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <div class="emoji">{slide.get('emoji', '🚀')}</div>
-                <h1 class="gradient-text">{slide.get('title', '')}</h1>
-                <h2>{slide.get('subtitle', '')}</h2>
+def escape_attr(value) -> str:
+    """转义属性值：总是转义（含引号），不保留 HTML 标签"""
+    return html.escape(str(value), quote=True)
+
+
+_CARD_STYLES = {
+    'negative': ('error', 'var(--accent-danger)'),
+    'positive': ('success', 'var(--accent-green)'),
+    'warning': ('warning', 'var(--accent-warning)'),
+}
+_DEFAULT_CARD_STYLE = ('', 'var(--accent-cyan)')
+
+
+def _render_title(slide: dict, notes: str, fragments: bool) -> str:
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <div class="emoji">{escape_html(slide.get('emoji', '🚀'))}</div>
+                <h1 class="gradient-text">{escape_html(slide.get('title', ''))}</h1>
+                <h2>{escape_html(slide.get('subtitle', ''))}</h2>
                 <div style="margin-top: 50px; text-align: center; color: var(--text-muted);">
-                    <p style="font-size: 1.5rem; color: #fff; margin-bottom: 8px;">{slide.get('author', 'Author')}</p>
-                    <p style="letter-spacing: 2px;">{slide.get('year', '2026')}</p>
+                    <p style="font-size: 1.5rem; color: #fff; margin-bottom: 8px;">{escape_html(slide.get('author', 'Author'))}</p>
+                    <p style="letter-spacing: 2px;">{escape_html(slide.get('year', '2026'))}</p>
                 </div>
             </div>
             """
-        
-        elif slide_type == 'list':
-            items_data = slide.get('items', [])
-            if fragments:
-                items = ''.join([f'<li class="fragment">{item}</li>' for item in items_data])
-            else:
-                items = ''.join([f'<li>{item}</li>' for item in items_data])
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+
+
+def _render_list(slide: dict, notes: str, fragments: bool) -> str:
+    items_data = slide.get('items', [])
+    if fragments:
+        items = ''.join([f'<li class="fragment">{escape_html(item)}</li>' for item in items_data])
+    else:
+        items = ''.join([f'<li>{escape_html(item)}</li>' for item in items_data])
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <div class="glass-card" style="width: 100%; max-width: 800px;">
                     <ul style="list-style: none; padding: 0;">{items}</ul>
                 </div>
             </div>
             """
-        
-        elif slide_type == 'grid':
-            cards = slide.get('cards', [])
-            cards_html = ''
-            for card in cards:
-                card_items = ''.join([f'<li>{item}</li>' for item in card.get('items', [])])
-                card_type = card.get('type', 'default')
-                if card_type == 'negative':
-                    card_class = 'error'
-                    border_color = 'var(--accent-danger)'
-                elif card_type == 'positive':
-                    card_class = 'success'
-                    border_color = 'var(--accent-green)'
-                elif card_type == 'warning':
-                    card_class = 'warning'
-                    border_color = 'var(--accent-warning)'
-                else:
-                    card_class = ''
-                    border_color = 'var(--accent-cyan)'
-                    
-                cards_html += f"""
+
+
+def _render_grid(slide: dict, notes: str, fragments: bool) -> str:
+    cards_html = []
+    for card in slide.get('cards', []):
+        card_items = ''.join([f'<li>{escape_html(item)}</li>' for item in card.get('items', [])])
+        card_class, border_color = _CARD_STYLES.get(card.get('type', 'default'), _DEFAULT_CARD_STYLE)
+        cards_html.append(f"""
                 <div class="glass-card" style="border-top: 4px solid {border_color};">
-                    <h3 class="{card_class}">{card.get('title', '')}</h3>
+                    <h3 class="{card_class}">{escape_html(card.get('title', ''))}</h3>
                     <ul>{card_items}</ul>
                 </div>
-                """
-            
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+                """)
+    
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <p style="text-align: center; font-size: 1.4rem; color: var(--text-muted); margin-bottom: 30px;">
-                    {slide.get('description', '')}
+                    {escape_html(slide.get('description', ''))}
                 </p>
-                <div class="grid-layout" style="max-width: 1000px;">{cards_html}</div>
+                <div class="grid-layout" style="max-width: 1000px;">{''.join(cards_html)}</div>
             </div>
             """
-        
-        elif slide_type == 'quote':
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
+
+
+def _render_quote(slide: dict, notes: str, fragments: bool) -> str:
+    return f"""
+            <div class="slide" data-notes="{notes}">
                 <div class="glass-card quote">
-                    <span style="display:block; margin-bottom: 20px; color: var(--text-main);">{slide.get('text', '')}</span>
-                    <span class="gradient-text" style="font-weight: 600; font-size: 1.2em;">{slide.get('highlight', '')}</span>
+                    <span style="display:block; margin-bottom: 20px; color: var(--text-main);">{escape_html(slide.get('text', ''))}</span>
+                    <span class="gradient-text" style="font-weight: 600; font-size: 1.2em;">{escape_html(slide.get('highlight', ''))}</span>
                 </div>
             </div>
             """
-        
-        elif slide_type == 'tasks':
-            tasks_data = slide.get('tasks', [])
-            if fragments:
-                tasks_html = ''.join([
-                    f'<li class="fragment" style="margin-bottom: 30px;"><span class="highlight">{task.get("title", "")}</span><br><span style="font-size: 0.85em; color: var(--text-muted);">{task.get("desc", "")}</span></li>' 
-                    for task in tasks_data
-                ])
-            else:
-                tasks_html = ''.join([
-                    f'<li style="margin-bottom: 30px;"><span class="highlight">{task.get("title", "")}</span><br><span style="font-size: 0.85em; color: var(--text-muted);">{task.get("desc", "")}</span></li>' 
-                    for task in tasks_data
-                ])
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+
+
+def _render_tasks(slide: dict, notes: str, fragments: bool) -> str:
+    li_open = '<li class="fragment" style="margin-bottom: 30px;">' if fragments else '<li style="margin-bottom: 30px;">'
+    tasks_html = ''.join([
+        f'{li_open}<span class="highlight">{escape_html(task.get("title", ""))}</span><br><span style="font-size: 0.85em; color: var(--text-muted);">{escape_html(task.get("desc", ""))}</span></li>'
+        for task in slide.get('tasks', [])
+    ])
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <div class="glass-card" style="width: 100%; max-width: 900px;">
                     <ol style="padding-left: 20px;">{tasks_html}</ol>
                 </div>
             </div>
             """
-        
-        elif slide_type == 'end':
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
+
+
+def _render_end(slide: dict, notes: str, fragments: bool) -> str:
+    return f"""
+            <div class="slide" data-notes="{notes}">
                 <div class="emoji" style="font-size: 5rem;">🎉</div>
-                <h1 class="gradient-text">{slide.get('title', 'Thank You!')}</h1>
-                <h2 style="color: var(--text-muted); text-shadow: none;">{slide.get('subtitle', '')}</h2>
+                <h1 class="gradient-text">{escape_html(slide.get('title', 'Thank You!'))}</h1>
+                <h2 style="color: var(--text-muted); text-shadow: none;">{escape_html(slide.get('subtitle', ''))}</h2>
                 <div class="glass-card" style="margin-top: 40px; padding: 30px 60px; text-align: center;">
-                    <p style="font-size: 1.8rem; margin-bottom: 10px; font-weight: bold;">{slide.get('author', '')}</p>
-                    <p style="color: var(--text-muted); margin-bottom: 10px;">📧 {slide.get('email', '')}</p>
-                    <p style="color: var(--accent-cyan);">💬 {slide.get('contact', '')}</p>
+                    <p style="font-size: 1.8rem; margin-bottom: 10px; font-weight: bold;">{escape_html(slide.get('author', ''))}</p>
+                    <p style="color: var(--text-muted); margin-bottom: 10px;">📧 {escape_html(slide.get('email', ''))}</p>
+                    <p style="color: var(--accent-cyan);">💬 {escape_html(slide.get('contact', ''))}</p>
                 </div>
             </div>
             """
-        
-        elif slide_type == 'mermaid':
-            code = slide.get('code', '')
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+
+
+def _render_mermaid(slide: dict, notes: str, fragments: bool) -> str:
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <p style="text-align: center; font-size: 1.2rem; color: var(--text-muted); margin-bottom: 20px;">
-                    {slide.get('description', '')}
+                    {escape_html(slide.get('description', ''))}
                 </p>
                 <div class="mermaid-wrapper">
                     <pre class="mermaid" style="display:none;">
-{code}
+{slide.get('code', '')}
                     </pre>
                 </div>
             </div>
             """
-        
-        elif slide_type == 'image':
-            img_src = slide.get('src', '')
-            img_alt = slide.get('alt', '')
-            caption = slide.get('caption', '')
-            fit = slide.get('fit', 'contain')
-            
-            caption_html = f'<p class="image-caption">{caption}</p>' if caption else ''
-            
-            html_content = f"""
-            <div class="slide slide-image" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
-                <div class="image-container" style="--fit: {fit};">
-                    <img src="{img_src}" alt="{img_alt}" loading="lazy">
+
+
+def _render_image(slide: dict, notes: str, fragments: bool) -> str:
+    caption = slide.get('caption', '')
+    caption_html = f'<p class="image-caption">{escape_html(caption)}</p>' if caption else ''
+    
+    return f"""
+            <div class="slide slide-image" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
+                <div class="image-container" style="--fit: {escape_attr(slide.get('fit', 'contain'))};">
+                    <img src="{escape_attr(slide.get('src', ''))}" alt="{escape_attr(slide.get('alt', ''))}" loading="lazy">
                 </div>
                 {caption_html}
             </div>
             """
-        
-        elif slide_type == 'code':
-            code = slide.get('code', '')
-            language = slide.get('language', 'javascript')
-            filename = slide.get('filename', '')
-            
-            escaped_code = html.escape(code)
-            
-            filename_html = f'<div class="code-filename"><span class="dot red"></span><span class="dot yellow"></span><span class="dot green"></span><span class="filename-text">{filename}</span></div>' if filename else '<div class="code-filename"><span class="dot red"></span><span class="dot yellow"></span><span class="dot green"></span></div>'
-            
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+
+
+_CODE_DOTS = '<span class="dot red"></span><span class="dot yellow"></span><span class="dot green"></span>'
+
+
+def _render_code(slide: dict, notes: str, fragments: bool) -> str:
+    language = slide.get('language', 'javascript')
+    filename = slide.get('filename', '')
+    escaped_code = html.escape(slide.get('code', ''))
+    
+    if filename:
+        filename_html = f'<div class="code-filename">{_CODE_DOTS}<span class="filename-text">{html.escape(filename)}</span></div>'
+    else:
+        filename_html = f'<div class="code-filename">{_CODE_DOTS}</div>'
+    
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <p style="text-align: center; font-size: 1.2rem; color: var(--text-muted); margin-bottom: 20px;">
-                    {slide.get('description', '')}
+                    {escape_html(slide.get('description', ''))}
                 </p>
                 <div class="code-wrapper">
                     {filename_html}
-                    <pre class="code-block"><code class="language-{language}">{escaped_code}</code></pre>
+                    <pre class="code-block"><code class="language-{escape_attr(language)}">{escaped_code}</code></pre>
                 </div>
             </div>
             """
-        
-        elif slide_type == 'two-column':
-            left = slide.get('left', {})
-            right = slide.get('right', {})
-            
-            def render_column(col):
-                col_type = col.get('type', 'text')
-                if col_type == 'image':
-                    return f'<img src="{col.get("src", "")}" alt="{col.get("alt", "")}" class="column-image">'
-                elif col_type == 'list':
-                    items = ''.join([f'<li>{item}</li>' for item in col.get('items', [])])
-                    return f'<ul class="column-list">{items}</ul>'
-                elif col_type == 'code':
-                    escaped = html.escape(col.get('code', ''))
-                    lang = col.get('language', 'javascript')
-                    return f'<pre class="column-code"><code class="language-{lang}">{escaped}</code></pre>'
-                else:
-                    return f'<div class="column-text">{col.get("content", "")}</div>'
-            
-            left_title = f'<h3>{left.get("title", "")}</h3>' if left.get('title') else ''
-            right_title = f'<h3>{right.get("title", "")}</h3>' if right.get('title') else ''
-            
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+
+
+def _render_column(col: dict) -> str:
+    col_type = col.get('type', 'text')
+    if col_type == 'image':
+        return f'<img src="{escape_attr(col.get("src", ""))}" alt="{escape_attr(col.get("alt", ""))}" class="column-image">'
+    elif col_type == 'list':
+        items = ''.join([f'<li>{escape_html(item)}</li>' for item in col.get('items', [])])
+        return f'<ul class="column-list">{items}</ul>'
+    elif col_type == 'code':
+        escaped = html.escape(col.get('code', ''))
+        lang = col.get('language', 'javascript')
+        return f'<pre class="column-code"><code class="language-{escape_attr(lang)}">{escaped}</code></pre>'
+    else:
+        return f'<div class="column-text">{escape_html(col.get("content", ""))}</div>'
+
+
+def _render_two_column(slide: dict, notes: str, fragments: bool) -> str:
+    left = slide.get('left', {})
+    right = slide.get('right', {})
+    left_title = f'<h3>{escape_html(left.get("title", ""))}</h3>' if left.get('title') else ''
+    right_title = f'<h3>{escape_html(right.get("title", ""))}</h3>' if right.get('title') else ''
+    
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <div class="two-column-layout">
                     <div class="column left-column glass-card">
                         {left_title}
-                        {render_column(left)}
+                        {_render_column(left)}
                     </div>
                     <div class="column right-column glass-card">
                         {right_title}
-                        {render_column(right)}
+                        {_render_column(right)}
                     </div>
                 </div>
             </div>
             """
-        
-        elif slide_type == 'timeline':
-            events = slide.get('events', [])
-            events_html = ''
-            for idx, event in enumerate(events):
-                position = 'left' if idx % 2 == 0 else 'right'
-                fragment_attr = ' class="fragment"' if fragments else ''
-                events_html += f"""
+
+
+def _render_timeline(slide: dict, notes: str, fragments: bool) -> str:
+    fragment_attr = ' class="fragment"' if fragments else ''
+    events_html = []
+    for idx, event in enumerate(slide.get('events', [])):
+        position = 'left' if idx % 2 == 0 else 'right'
+        events_html.append(f"""
                 <div class="timeline-item {position}"{fragment_attr}>
                     <div class="timeline-content glass-card">
-                        <span class="timeline-date">{event.get('date', '')}</span>
-                        <h3>{event.get('title', '')}</h3>
-                        <p>{event.get('description', '')}</p>
+                        <span class="timeline-date">{escape_html(event.get('date', ''))}</span>
+                        <h3>{escape_html(event.get('title', ''))}</h3>
+                        <p>{escape_html(event.get('description', ''))}</p>
                     </div>
                 </div>
-                """
-            
-            html_content = f"""
-            <div class="slide slide-timeline" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+                """)
+    
+    return f"""
+            <div class="slide slide-timeline" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <div class="timeline-container">
                     <div class="timeline-line"></div>
-                    {events_html}
+                    {''.join(events_html)}
                 </div>
             </div>
             """
-        
-        elif slide_type == 'video':
-            video_src = slide.get('src', '')
-            video_type = slide.get('video_type', 'local')
-            autoplay = slide.get('autoplay', False)
-            
-            if video_type == 'youtube':
-                video_id = video_src.split('/')[-1].split('?')[0].replace('watch?v=', '')
-                autoplay_param = '&autoplay=1' if autoplay else ''
-                video_html = f'<iframe src="https://www.youtube.com/embed/{video_id}?rel=0{autoplay_param}" frameborder="0" allowfullscreen></iframe>'
-            elif video_type == 'bilibili':
-                video_html = f'<iframe src="//player.bilibili.com/player.html?bvid={video_src}&page=1" scrolling="no" border="0" frameborder="no" framespacing="0" allowfullscreen="true"></iframe>'
-            else:
-                autoplay_attr = 'autoplay' if autoplay else ''
-                video_html = f'<video controls {autoplay_attr}><source src="{video_src}" type="video/mp4"></video>'
-            
-            html_content = f"""
-            <div class="slide slide-video" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+
+
+def _render_video(slide: dict, notes: str, fragments: bool) -> str:
+    video_src = slide.get('src', '')
+    video_type = slide.get('video_type', 'local')
+    autoplay = slide.get('autoplay', False)
+    
+    if video_type == 'youtube':
+        video_id = video_src.split('/')[-1].split('?')[0].replace('watch?v=', '')
+        autoplay_param = '&autoplay=1' if autoplay else ''
+        video_html = f'<iframe src="https://www.youtube.com/embed/{escape_attr(video_id)}?rel=0{autoplay_param}" frameborder="0" allowfullscreen></iframe>'
+    elif video_type == 'bilibili':
+        video_html = f'<iframe src="//player.bilibili.com/player.html?bvid={escape_attr(video_src)}&page=1" scrolling="no" border="0" frameborder="no" framespacing="0" allowfullscreen="true"></iframe>'
+    else:
+        autoplay_attr = 'autoplay' if autoplay else ''
+        video_html = f'<video controls {autoplay_attr}><source src="{escape_attr(video_src)}" type="video/mp4"></video>'
+    
+    return f"""
+            <div class="slide slide-video" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <div class="video-container">
                     {video_html}
                 </div>
             </div>
             """
-        
-        elif slide_type == 'stats':
-            stats = slide.get('stats', [])
-            stats_html = ''
-            for stat in stats:
-                icon = stat.get('icon', '📊')
-                stats_html += f"""
+
+
+def _render_stats(slide: dict, notes: str, fragments: bool) -> str:
+    stats_html = []
+    for stat in slide.get('stats', []):
+        stats_html.append(f"""
                 <div class="stat-card glass-card">
-                    <div class="stat-icon">{icon}</div>
-                    <div class="stat-value gradient-text">{stat.get('value', '0')}</div>
-                    <div class="stat-label">{stat.get('label', '')}</div>
+                    <div class="stat-icon">{escape_html(stat.get('icon', '📊'))}</div>
+                    <div class="stat-value gradient-text">{escape_html(stat.get('value', '0'))}</div>
+                    <div class="stat-label">{escape_html(stat.get('label', ''))}</div>
                 </div>
-                """
-            
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
+                """)
+    
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
                 <p style="text-align: center; font-size: 1.2rem; color: var(--text-muted); margin-bottom: 30px;">
-                    {slide.get('description', '')}
+                    {escape_html(slide.get('description', ''))}
                 </p>
-                <div class="stats-grid">{stats_html}</div>
+                <div class="stats-grid">{''.join(stats_html)}</div>
             </div>
             """
-        
-        else:
-            html_content = f"""
-            <div class="slide" data-notes="{escape_html(notes)}">
-                <h2>{slide.get('title', '')}</h2>
-                <div class="glass-card">{slide.get('content', '')}</div>
+
+
+def _render_default(slide: dict, notes: str, fragments: bool) -> str:
+    return f"""
+            <div class="slide" data-notes="{notes}">
+                <h2>{escape_html(slide.get('title', ''))}</h2>
+                <div class="glass-card">{escape_html(slide.get('content', ''))}</div>
             </div>
             """
+
+
+# 幻灯片类型 -> 渲染函数；未知类型回退到 _render_default
+SLIDE_RENDERERS = {
+    'title': _render_title,
+    'list': _render_list,
+    'grid': _render_grid,
+    'quote': _render_quote,
+    'tasks': _render_tasks,
+    'end': _render_end,
+    'mermaid': _render_mermaid,
+    'image': _render_image,
+    'code': _render_code,
+    'two-column': _render_two_column,
+    'timeline': _render_timeline,
+    'video': _render_video,
+    'stats': _render_stats,
+}
+
+
+def generate_slides(content: list) -> tuple[str, list]:
+    """生成幻灯片 HTML，返回 (slides_html, notes_list)"""
+    slides_html = []
+    notes_list = []
+    
+    for slide in content:
+        notes = slide.get('notes', '')
+        notes_list.append(notes)
         
-        slides_html.append(html_content)
+        render = SLIDE_RENDERERS.get(slide.get('type', 'default'), _render_default)
+        slides_html.append(render(slide, escape_attr(notes), slide.get('fragments', False)))
     
     return '\n'.join(slides_html), notes_list
 
@@ -431,6 +464,8 @@ def get_style_class(style: str) -> str:
 
 def generate_ppt(config_path: str, output_path: str):
     """生成 PPT"""
+    import json
+    
     print(f"🎨 正在生成 PPT...")
     print(f"📄 配置文件：{config_path}")
     print(f"📤 输出文件：{output_path}")
@@ -451,18 +486,22 @@ def generate_ppt(config_path: str, output_path: str):
     style = config.get('style', 'default')
     style_class = get_style_class(style)
     
-    html_output = template.replace('{{TITLE}}', config.get('title', 'Presentation'))
-    html_output = html_output.replace('{{TOTAL_SLIDES}}', str(len(config.get('slides', []))))
-    html_output = html_output.replace('{{STYLE_CLASS}}', style_class)
-    html_output = html_output.replace('<!-- SLIDES_PLACEHOLDER -->', slides_html)
-    html_output = html_output.replace('/* THEME_CSS_PLACEHOLDER */', theme_css)
-    html_output = html_output.replace('/* NOTES_JSON_PLACEHOLDER */', f'const speakerNotes = {notes_json};')
+    # <title> holds plain text only, so the deck title is always escaped;
+    # escape_html would let a title like 'Q&A <intro>' through unchanged
+    subs = dict(zip(_PLACEHOLDERS, (
+        html.escape(str(config.get('title', 'Presentation'))),
+        str(len(config.get('slides', []))),
+        style_class,
+        slides_html,
+        theme_css,
+        f'const speakerNotes = {notes_json};',
+    )))
+    html_output = _PLACEHOLDER_RE.sub(lambda m: subs[m.group()], template)
     
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output, 'w', encoding='utf-8') as f:
-        f.write(html_output)
+    output.write_bytes(html_output.encode('utf-8'))
     
     print(f"✅ PPT 生成成功！")
     print(f"📊 共 {len(config.get('slides', []))} 页")
@@ -4,11 +4,62 @@ Feedback Analyzer - Analyze feedback data and generate insights
 """
 
 import argparse
+import functools
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
 
 
+# Markers counted in each feedback file, encoded once so they can be counted
+# on the raw UTF-8 bytes. UTF-8 only matches on character boundaries and no
+# marker overlaps another, so the counts equal those on the decoded text.
+_ITEM_MARKERS = tuple(marker.encode('utf-8') for marker in ('## 问题描述', '## 建议描述'))
+_TYPE_MARKERS = {
+    name: marker.encode('utf-8') for name, marker in (
+        ('Bug', '🔴 Bug'),
+        ('功能缺失', '🟡 功能缺失'),
+        ('体验优化', '🟢 体验优化'),
+        ('新功能', '✨ 新功能'),
+        ('性能优化', '🚀 性能优化'),
+        ('文档改进', '📝 文档改进'),
+    )
+}
+_SEVERITY_MARKERS = {
+    name: marker.encode('utf-8') for name, marker in (
+        ('P0', '🔴 严重'),
+        ('P1', '🟡 主要'),
+        ('P2', '🟢 一般'),
+    )
+}
+
+_ALL_MARKERS = _ITEM_MARKERS + tuple(_TYPE_MARKERS.values()) + tuple(_SEVERITY_MARKERS.values())
+_LONGEST_MARKER = max(map(len, _ALL_MARKERS))
+# Feedback files are read this much at a time, so memory stays flat however
+# large an aggregated log gets
+_CHUNK_SIZE = 1 << 20
+
+
+def _count_markers(file_path: str) -> dict:
+    """Occurrences of every marker in a file, read chunk by chunk
+    
+    A marker cut by a chunk boundary is counted in a small window made of
+    its length minus one byte from either side. Such a window is too short
+    to hold a match that sits inside one chunk, so nothing is counted twice.
+    """
+    counts = dict.fromkeys(_ALL_MARKERS, 0)
+    tail = b''
+    with open(file_path, 'rb') as f:
+        for chunk in iter(functools.partial(f.read, _CHUNK_SIZE), b''):
+            for marker in _ALL_MARKERS:
+                keep = len(marker) - 1
+                if tail:
+                    counts[marker] += (tail[-keep:] + chunk[:keep]).count(marker)
+                counts[marker] += chunk.count(marker)
+            # Joined with the old tail so a short read still leaves enough bytes
+            tail = (tail + chunk[-_LONGEST_MARKER:])[-_LONGEST_MARKER:]
+    return counts
+
+
 def analyze_feedback(feedback_files: list, output: str):
     """Analyze feedback from multiple sources"""
     
@@ -26,32 +77,28 @@ def analyze_feedback(feedback_files: list, output: str):
     # Parse feedback files
     for file_path in feedback_files:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Raw bytes: no decode, and bytes.count runs over 1-byte units
+            # instead of the 4-byte ones a str holding emoji is stored in
+            counts = _count_markers(file_path)
                 
             # Count feedback items
-            stats['total_feedback'] += content.count('## 问题描述') + content.count('## 建议描述')
+            stats['total_feedback'] += sum(counts[marker] for marker in _ITEM_MARKERS)
             
             # Count by type
-            stats['by_type']['Bug'] += content.count('🔴 Bug')
-            stats['by_type']['功能缺失'] += content.count('🟡 功能缺失')
-            stats['by_type']['体验优化'] += content.count('🟢 体验优化')
-            stats['by_type']['新功能'] += content.count('✨ 新功能')
-            stats['by_type']['性能优化'] += content.count('🚀 性能优化')
-            stats['by_type']['文档改进'] += content.count('📝 文档改进')
+            for name, marker in _TYPE_MARKERS.items():
+                stats['by_type'][name] += counts[marker]
             
             # Count by severity
-            stats['by_severity']['P0'] += content.count('🔴 严重')
-            stats['by_severity']['P1'] += content.count('🟡 主要')
-            stats['by_severity']['P2'] += content.count('🟢 一般')
+            for name, marker in _SEVERITY_MARKERS.items():
+                stats['by_severity'][name] += counts[marker]
             
         except Exception as e:
             print(f"  ⚠️ 读取失败 {file_path}: {e}")
     
-    # Generate analysis report
+    # Generate analysis report; sections are collected and joined once at the end
     total = max(1, stats['total_feedback'])
     
-    report = f"""# 反馈数据分析报告
+    parts = [f"""# 反馈数据分析报告
 
 **分析时间:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
 **反馈来源:** {len(feedback_files)} 个文件  
@@ -103,53 +150,53 @@ def analyze_feedback(feedback_files: list, output: str):
 ## 🎯 关键发现
 
 ### 优势
-"""
+"""]
     
     # Identify strengths
     if stats['by_severity']['P0'] == 0:
-        report += "- ✅ 无严重 Bug，质量稳定\n"
+        parts.append("- ✅ 无严重 Bug，质量稳定\n")
     
     if stats['by_type']['新功能'] > stats['by_type']['Bug']:
-        report += "- ✅ 新功能需求多于 Bug，产品健康发展\n"
+        parts.append("- ✅ 新功能需求多于 Bug，产品健康发展\n")
     
-    report += """
+    parts.append("""
 ### 需改进
-"""
+""")
     
     # Identify areas for improvement
     if stats['by_type']['Bug'] > 10:
-        report += "- ⚠️ Bug 数量较多，需要加强质量控制\n"
+        parts.append("- ⚠️ Bug 数量较多，需要加强质量控制\n")
     
     if stats['by_severity']['P0'] > 0:
-        report += f"- 🔴 有 {stats['by_severity']['P0']} 个严重问题，需要立即处理\n"
+        parts.append(f"- 🔴 有 {stats['by_severity']['P0']} 个严重问题，需要立即处理\n")
     
-    report += f"""
+    parts.append(f"""
 ---
 
 ## 💡 改进建议
 
 ### 质量改进
-"""
+""")
     
     if stats['by_type']['Bug'] > 5:
-        report += "- [ ] 加强代码审查\n"
-        report += "- [ ] 增加自动化测试\n"
-        report += "- [ ] 建立 Bug 预防机制\n"
+        parts.append("- [ ] 加强代码审查\n")
+        parts.append("- [ ] 增加自动化测试\n")
+        parts.append("- [ ] 建立 Bug 预防机制\n")
     
-    report += """
+    parts.append("""
 ### 流程改进
 - [ ] 建立反馈响应 SLA
 - [ ] 定期反馈分析会议
 - [ ] 用户反馈闭环机制
 
 ### 产品改进
-"""
+""")
     
     if stats['by_type']['新功能'] > 3:
-        report += "- [ ] 评估高需求新功能\n"
-        report += "- [ ] 制定产品路线图\n"
+        parts.append("- [ ] 评估高需求新功能\n")
+        parts.append("- [ ] 制定产品路线图\n")
     
-    report += f"""
+    parts.append(f"""
 ---
 
 ## 📋 行动计划
@@ -174,21 +221,21 @@ def analyze_feedback(feedback_files: list, output: str):
 ## 📊 数据明细
 
 ### 原始数据源
-"""
+""")
     
     for file in feedback_files:
-        report += f"- {file}\n"
+        parts.append(f"- {file}\n")
     
-    report += f"""
+    parts.append(f"""
 ---
 
 **生成工具:** skill-manager/analyze-feedback.py  
 **下次分析:** 2026-03-27
-"""
+""")
     
+    # Encoded once and written as bytes, skipping the text layer's buffering
     output_path = Path(output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report)
+    output_path.write_bytes(''.join(parts).encode('utf-8'))
     
     print(f"✅ 分析报告已生成：{output_path}")
     print(f"\n📊 关键指标:")
@@ -4,7 +4,6 @@ Skill Feedback Collector - Collect and manage user feedback for skills
 """
 
 import argparse
-import json
 from datetime import datetime
 from pathlib import Path
 
@@ -4,82 +4,91 @@ Changelog Generator - Generate CHANGELOG from improvement records
 """
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 
+# Keywords that put a record under each section, encoded once so records can
+# be searched as raw bytes; UTF-8 substrings match exactly where the decoded
+# text would
+_FEATURE_KEYWORDS = tuple(kw.encode('utf-8') for kw in ('新增', '新功能'))
+_FIX_KEYWORDS = tuple(kw.encode('utf-8') for kw in ('修复', 'Bug'))
+_OPTIMIZATION_KEYWORDS = tuple(kw.encode('utf-8') for kw in ('优化', '性能'))
+_DOC_KEYWORDS = tuple(kw.encode('utf-8') for kw in ('文档',))
+
+# Thread count for reading records; reads release the GIL, so oversubscribe
+MAX_WORKERS = (os.cpu_count() or 1) * 2
+
+
+def _read_record(record_file: str):
+    """Raw bytes of an improvement record, or the error that stopped the read"""
+    try:
+        # Only keyword presence matters, so the record is never decoded
+        with open(record_file, 'rb') as f:
+            return f.read()
+    except Exception as e:
+        return e
+
+
 def generate_changelog(improvement_records: list, version: str, output: str):
     """Generate CHANGELOG from improvement records"""
     
     print(f"📝 生成变更日志：{version}")
     
-    changelog = f"""## [{version}] - {datetime.now().strftime('%Y-%m-%d')}
+    # Sections are collected and joined once at the end
+    parts = [f"""## [{version}] - {datetime.now().strftime('%Y-%m-%d')}
 
 ### ✨ 新增
-"""
+"""]
     
-    # Parse improvement records (simplified)
-    new_features = []
-    bug_fixes = []
-    optimizations = []
-    docs = []
+    # Parse improvement records (simplified); each section has a single
+    # entry, so only the number of records matching it is kept
+    new_features = 0
+    bug_fixes = 0
+    optimizations = 0
+    docs = 0
     
-    for record_file in improvement_records:
-        try:
-            with open(record_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+    # Records are read concurrently; map() keeps them in the order given
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        contents = executor.map(_read_record, improvement_records)
+        for record_file, content in zip(improvement_records, contents):
+            if isinstance(content, Exception):
+                print(f"  ⚠️ 读取失败 {record_file}: {content}")
+                continue
             
             # Simple parsing
-            if '新增' in content or '新功能' in content:
-                new_features.append('功能改进')
-            if '修复' in content or 'Bug' in content:
-                bug_fixes.append('问题修复')
-            if '优化' in content or '性能' in content:
-                optimizations.append('性能优化')
-            if '文档' in content:
-                docs.append('文档更新')
-                
-        except Exception as e:
-            print(f"  ⚠️ 读取失败 {record_file}: {e}")
+            if any(kw in content for kw in _FEATURE_KEYWORDS):
+                new_features += 1
+            if any(kw in content for kw in _FIX_KEYWORDS):
+                bug_fixes += 1
+            if any(kw in content for kw in _OPTIMIZATION_KEYWORDS):
+                optimizations += 1
+            if any(kw in content for kw in _DOC_KEYWORDS):
+                docs += 1
     
     # Add sections
-    if new_features:
-        for item in set(new_features):
-            changelog += f"- {item}\n"
-    else:
-        changelog += "- 暂无\n"
+    parts.append("- 功能改进\n" if new_features else "- 暂无\n")
     
-    changelog += "\n### 🐛 修复\n"
-    if bug_fixes:
-        for item in set(bug_fixes):
-            changelog += f"- {item}\n"
-    else:
-        changelog += "- 暂无\n"
+    parts.append("\n### 🐛 修复\n")
+    parts.append("- 问题修复\n" if bug_fixes else "- 暂无\n")
     
-    changelog += "\n### ⚡ 优化\n"
-    if optimizations:
-        for item in set(optimizations):
-            changelog += f"- {item}\n"
-    else:
-        changelog += "- 暂无\n"
+    parts.append("\n### ⚡ 优化\n")
+    parts.append("- 性能优化\n" if optimizations else "- 暂无\n")
     
-    changelog += "\n### 📝 文档\n"
-    if docs:
-        for item in set(docs):
-            changelog += f"- {item}\n"
-    else:
-        changelog += "- 暂无\n"
+    parts.append("\n### 📝 文档\n")
+    parts.append("- 文档更新\n" if docs else "- 暂无\n")
     
     output_path = Path(output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(changelog)
+    output_path.write_bytes(''.join(parts).encode('utf-8'))
     
     print(f"✅ 变更日志已生成：{output_path}")
     print(f"\n📋 内容概览:")
-    print(f"  新增：{len(new_features)} 项")
-    print(f"  修复：{len(bug_fixes)} 项")
-    print(f"  优化：{len(optimizations)} 项")
-    print(f"  文档：{len(docs)} 项")
+    print(f"  新增：{new_features} 项")
+    print(f"  修复：{bug_fixes} 项")
+    print(f"  优化：{optimizations} 项")
+    print(f"  文档：{docs} 项")
 
 
 def main():
@@ -14,20 +14,14 @@ def track_progress(improvement_plan: str, output: str):
     print(f"📊 追踪改进进度...")
     
     # Parse improvement plan
-    tasks = {
-        'todo': [],
-        'in_progress': [],
-        'testing': [],
-        'done': []
-    }
-    
     try:
-        with open(improvement_plan, 'r', encoding='utf-8') as f:
+        # Raw bytes: the checkboxes are ASCII, so no decode is needed
+        with open(improvement_plan, 'rb') as f:
             content = f.read()
         
-        # Simple parsing - count checkboxes
-        total_tasks = content.count('- [ ]') + content.count('- [x]') + content.count('- [X]')
-        completed_tasks = content.count('- [x]') + content.count('- [X]')
+        # Simple parsing - count checkboxes, scanning once per checkbox form
+        completed_tasks = content.count(b'- [x]') + content.count(b'- [X]')
+        total_tasks = content.count(b'- [ ]') + completed_tasks
         
         progress = completed_tasks * 100 // max(1, total_tasks)
         
@@ -37,10 +31,14 @@ def track_progress(improvement_plan: str, output: str):
         completed_tasks = 0
         progress = 0
     
-    # Generate status report
-    report = f"""# 改进进度追踪
+    # One clock read, so every date in the report agrees
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    
+    # Generate status report; sections are collected and joined once at the end
+    parts = [f"""# 改进进度追踪
 
-**更新时间:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
+**更新时间:** {now.strftime('%Y-%m-%d %H:%M:%S')}  
 **改进计划:** {improvement_plan}
 
 ---
@@ -112,16 +110,16 @@ def track_progress(improvement_plan: str, output: str):
 ## ⚠️ 风险预警
 
 ### 延期风险
-"""
+"""]
     
     if progress < 50 and total_tasks > 5:
-        report += "- 🔴 进度滞后，需要加快\n"
+        parts.append("- 🔴 进度滞后，需要加快\n")
     elif progress < 80:
-        report += "- 🟡 进度正常，需继续保持\n"
+        parts.append("- 🟡 进度正常，需继续保持\n")
     else:
-        report += "- 🟢 进度良好\n"
+        parts.append("- 🟢 进度良好\n")
     
-    report += f"""
+    parts.append(f"""
 ### 资源风险
 - [ ] 人力资源充足
 - [ ] 时间资源充足
@@ -132,20 +130,20 @@ def track_progress(improvement_plan: str, output: str):
 ## 💡 改进建议
 
 ### 进度管理
-"""
+""")
     
     if progress < 30:
-        report += "- [ ] 召开进度协调会\n"
-        report += "- [ ] 调整优先级\n"
-        report += "- [ ] 增加资源投入\n"
+        parts.append("- [ ] 召开进度协调会\n")
+        parts.append("- [ ] 调整优先级\n")
+        parts.append("- [ ] 增加资源投入\n")
     elif progress < 70:
-        report += "- [ ] 保持当前节奏\n"
-        report += "- [ ] 关注关键任务\n"
+        parts.append("- [ ] 保持当前节奏\n")
+        parts.append("- [ ] 关注关键任务\n")
     else:
-        report += "- [ ] 准备验收\n"
-        report += "- [ ] 准备发布\n"
+        parts.append("- [ ] 准备验收\n")
+        parts.append("- [ ] 准备发布\n")
     
-    report += f"""
+    parts.append(f"""
 ### 质量保障
 - [ ] 代码审查
 - [ ] 测试覆盖
@@ -155,7 +153,7 @@ def track_progress(improvement_plan: str, output: str):
 
 ## 📝 更新日志
 
-### {datetime.now().strftime('%Y-%m-%d')}
+### {today}
 - 创建进度追踪
 - 总任务：{total_tasks} 个
 - 已完成：{completed_tasks} 个
@@ -172,12 +170,11 @@ def track_progress(improvement_plan: str, output: str):
 ---
 
 **更新频率:** 每日更新  
-**下次更新:** {datetime.now().strftime('%Y-%m-%d')} + 1 天
-"""
+**下次更新:** {today} + 1 天
+""")
     
     output_path = Path(output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report)
+    output_path.write_bytes(''.join(parts).encode('utf-8'))
     
     print(f"✅ 进度报告已生成：{output_path}")
     print(f"\n📊 进度概览:")
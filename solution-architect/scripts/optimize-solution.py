@@ -9,6 +9,15 @@ from datetime import datetime
 from pathlib import Path
 
 
+# The 12 chapters a complete solution has, in document order
+_REQUIRED_CHAPTERS = (
+    '需求背景', '产品目标', '系统目标', '系统架构',
+    '业务流程', '资金流程', '数据流程', '数据模型',
+    'API 设计', '表设计', '影响面分析', '任务拆分'
+)
+_DIAGRAM_PATTERNS = ('```mermaid', 'graph ', 'sequenceDiagram', 'erDiagram', 'flowchart')
+
+
 def evaluate_solution(content: str) -> dict:
     """Evaluate technical solution quality"""
     
@@ -27,27 +36,22 @@ def evaluate_solution(content: str) -> dict:
         'minor': []
     }
     
-    # Check completeness (12 chapters)
-    required_chapters = [
-        '需求背景', '产品目标', '系统目标', '系统架构',
-        '业务流程', '资金流程', '数据流程', '数据模型',
-        'API 设计', '表设计', '影响面分析', '任务拆分'
-    ]
-    
+    # Check completeness (12 chapters); each search stops at the first hit
     found_chapters = []
-    for chapter in required_chapters:
+    missing = []
+    for chapter in _REQUIRED_CHAPTERS:
         if chapter in content:
             found_chapters.append(chapter)
+        else:
+            missing.append(chapter)
     
-    scores['completeness'] = len(found_chapters) * 100 // 12
+    scores['completeness'] = len(found_chapters) * 100 // len(_REQUIRED_CHAPTERS)
     
-    if len(found_chapters) < 12:
-        missing = set(required_chapters) - set(found_chapters)
+    if missing:
         issues['critical'].append(f'缺少章节：{", ".join(missing)}')
     
     # Check diagrams
-    diagram_patterns = ['```mermaid', 'graph ', 'sequenceDiagram', 'erDiagram', 'flowchart']
-    has_diagrams = any(p in content for p in diagram_patterns)
+    has_diagrams = any(p in content for p in _DIAGRAM_PATTERNS)
     
     if not has_diagrams:
         issues['major'].append('缺少架构图表')
@@ -79,33 +83,58 @@ def evaluate_solution(content: str) -> dict:
     }
 
 
+# Sections a solution must have, with the starter content added when one is
+# missing; the block to append is built once here, not on every call
+_REQUIRED_SECTIONS = {
+    '## 1. 需求背景': '### 1.1 业务背景\n\n{{业务背景}}\n\n### 1.2 用户痛点\n\n{{用户痛点}}',
+    '## 2. 产品目标': '### 2.1 核心目标\n\n1. **目标 1**\n2. **目标 2**',
+    '## 3. 系统目标': '### 3.1 性能目标\n\n| 指标 | 目标 |\n|------|------|\n| 响应时间 | < 200ms |',
+    '## 4. 系统架构': '### 4.1 系统上下文\n\n```mermaid\ngraph TB\n    A[用户] --> B[系统]\n```',
+    '## 5. 业务流程': '### 5.1 主流程\n\n```mermaid\nflowchart TD\n    A[开始] --> B[结束]\n```',
+    '## 8. 数据模型': '### 8.1 实体关系\n\n```mermaid\nerDiagram\n    ENTITY1 ||--o{ ENTITY2 : relationship\n```',
+    '## 9. API 设计': '### 9.2 接口详情\n\n```http\nPOST /api/v1/resource\n```\n\n```json\n{"status": "success"}\n```',
+    '## 10. 表设计': '### 10.1 表结构\n\n```sql\nCREATE TABLE table_name (\n  id bigint PRIMARY KEY\n);\n```',
+    '## 12. 任务拆分': '### 12.1 开发任务\n\n| 任务 | 负责人 | 估算 |\n|------|--------|------|\n| DEV-001 | 张三 | 2 天 |'
+}
+_SECTION_INSERTS = tuple(
+    (section, f"\n\n{section}\n\n{template}\n") for section, template in _REQUIRED_SECTIONS.items()
+)
+
+
+def _task_section_has_table(content: str) -> bool:
+    """Whether a table follows the first '任务拆分', before the next '##' or '任务拆分'
+    
+    The same region as content.split('任务拆分')[1].split('##')[0], located
+    with find() instead of splitting the whole document twice.
+    """
+    start = content.find('任务拆分') + len('任务拆分')
+    end = len(content)
+    for stop in (content.find('##', start), content.find('任务拆分', start)):
+        if stop != -1:
+            end = min(end, stop)
+    return content.find('|', start, end) != -1
+
+
 def optimize_solution(content: str, level: str = 'standard') -> str:
     """Optimize technical solution document"""
     
     print(f"🔧 开始优化技术方案文档（{level}级别）...")
     
-    optimized = content
-    
-    # Add missing sections
-    required_sections = {
-        '## 1. 需求背景': '### 1.1 业务背景\n\n{{业务背景}}\n\n### 1.2 用户痛点\n\n{{用户痛点}}',
-        '## 2. 产品目标': '### 2.1 核心目标\n\n1. **目标 1**\n2. **目标 2**',
-        '## 3. 系统目标': '### 3.1 性能目标\n\n| 指标 | 目标 |\n|------|------|\n| 响应时间 | < 200ms |',
-        '## 4. 系统架构': '### 4.1 系统上下文\n\n```mermaid\ngraph TB\n    A[用户] --> B[系统]\n```',
-        '## 5. 业务流程': '### 5.1 主流程\n\n```mermaid\nflowchart TD\n    A[开始] --> B[结束]\n```',
-        '## 8. 数据模型': '### 8.1 实体关系\n\n```mermaid\nerDiagram\n    ENTITY1 ||--o{ ENTITY2 : relationship\n```',
-        '## 9. API 设计': '### 9.2 接口详情\n\n```http\nPOST /api/v1/resource\n```\n\n```json\n{"status": "success"}\n```',
-        '## 10. 表设计': '### 10.1 表结构\n\n```sql\nCREATE TABLE table_name (\n  id bigint PRIMARY KEY\n);\n```',
-        '## 12. 任务拆分': '### 12.1 开发任务\n\n| 任务 | 负责人 | 估算 |\n|------|--------|------|\n| DEV-001 | 张三 | 2 天 |'
-    }
-    
-    for section, template in required_sections.items():
-        if section not in optimized:
+    # Add missing sections. No section template contains another section's heading, so checking
+    # the original content is the same as checking the growing document;
+    # the additions are joined onto it once
+    added = []
+    for section, insert in _SECTION_INSERTS:
+        if section not in content:
             print(f"  ➕ 添加缺失章节：{section}")
             # Find appropriate place to insert
-            optimized += f"\n\n{section}\n\n{template}\n"
+            added.append(insert)
+    optimized = content + ''.join(added)
     
-    # Improve existing sections
+    # Improve existing sections. None of the inserted blocks changes what the
+    # later checks see, so the heading insertions are gathered here and made
+    # in one pass at the end
+    edits = {}
     if level in ['standard', 'deep']:
         # Add more details to architecture
         if '系统架构' in optimized and '```mermaid' not in optimized:
@@ -136,10 +165,10 @@ graph TB
     D --> E & F
 ```
 """
-            optimized = optimized.replace('## 4. 系统架构', f'## 4. 系统架构\n{arch_diagram}')
+            edits['## 4. 系统架构'] = f'## 4. 系统架构\n{arch_diagram}'
         
         # Add task breakdown if missing
-        if '任务拆分' in optimized and '|' not in optimized.split('任务拆分')[1].split('##')[0]:
+        if '任务拆分' in optimized and not _task_section_has_table(optimized):
             print("  📋 添加任务拆分表格...")
             task_table = """
 | 任务 ID | 任务名称 | 负责人 | 优先级 | 估算 (天) |
@@ -149,7 +178,7 @@ graph TB
 | DEV-003 | 前端开发 | 王五 | P1 | 5 |
 | DEV-004 | 测试 | 赵六 | P0 | 3 |
 """
-            optimized = optimized.replace('## 12. 任务拆分', f'## 12. 任务拆分\n{task_table}')
+            edits['## 12. 任务拆分'] = f'## 12. 任务拆分\n{task_table}'
     
     if level == 'deep':
         # Deep optimization: restructure and enhance
@@ -178,7 +207,11 @@ graph TB
 | 业务指标 | DAU | 10,000 | 15,000 |
 | 技术指标 | 响应时间 | 500ms | 200ms |
 """
-            optimized = optimized.replace('## 2. 产品目标', f'## 2. 产品目标\n{metrics_section}')
+            edits['## 2. 产品目标'] = f'## 2. 产品目标\n{metrics_section}'
+    
+    if edits:
+        headings = re.compile('|'.join(map(re.escape, edits)))
+        optimized = headings.sub(lambda m: edits[m.group()], optimized)
     
     return optimized
 
@@ -189,7 +222,8 @@ def generate_optimization_report(evaluation: dict, output: str):
     scores = evaluation['scores']
     issues = evaluation['issues']
     
-    report = f"""# 技术方案优化报告
+    # Sections are collected and joined once at the end
+    parts = [f"""# 技术方案优化报告
 
 **生成时间:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -214,20 +248,20 @@ def generate_optimization_report(evaluation: dict, output: str):
 
 ### 严重问题 ({len(issues['critical'])})
 
-"""
+"""]
     
     for i, issue in enumerate(issues['critical'], 1):
-        report += f"{i}. **{issue}**\n"
+        parts.append(f"{i}. **{issue}**\n")
     
-    report += f"\n### 主要问题 ({len(issues['major'])})\n\n"
+    parts.append(f"\n### 主要问题 ({len(issues['major'])})\n\n")
     for i, issue in enumerate(issues['major'], 1):
-        report += f"{i}. {issue}\n"
+        parts.append(f"{i}. {issue}\n")
     
-    report += f"\n### 次要问题 ({len(issues['minor'])})\n\n"
+    parts.append(f"\n### 次要问题 ({len(issues['minor'])})\n\n")
     for i, issue in enumerate(issues['minor'], 1):
-        report += f"{i}. {issue}\n"
+        parts.append(f"{i}. {issue}\n")
     
-    report += """
+    parts.append("""
 ---
 
 ## 💡 优化建议
@@ -259,11 +293,10 @@ def generate_optimization_report(evaluation: dict, output: str):
 - [ ] 添加风险评估
 - [ ] 补充成功指标
 
-"""
+""")
     
     output_path = Path(output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report)
+    output_path.write_bytes(''.join(parts).encode('utf-8'))
     
     print(f"✅ 优化报告已生成：{output_path}")
 
@@ -296,8 +329,7 @@ def main():
     
     # Write optimized file
     output_path = Path(args.output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(optimized)
+    output_path.write_bytes(optimized.encode('utf-8'))
     
     print(f"\n✅ 优化完成：{output_path}")
     print(f"📊 文档长度：{len(optimized.split())} 字")
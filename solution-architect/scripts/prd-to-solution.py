@@ -5,22 +5,19 @@ Converts Product Requirements Document into comprehensive technical solution
 """
 
 import argparse
-import json
-from datetime import datetime
+import time
 from pathlib import Path
+from string import Template
 
 
-def generate_technical_solution(prd_content: str, output: str, solution_type: str = 'full'):
-    """Generate complete technical solution from PRD"""
-    
-    print(f"🏗️  Generating technical solution from PRD...")
-    print(f"📋 PRD: {prd_content[:100]}...")
-    
-    content = f"""# 技术方案文档
+# The solution document; only the generation time and solution type vary.
+# A string.Template leaves the Mermaid/JSON braces and {{...}} fill-in
+# markers alone, and the literal is built once at import, not on every call.
+_SOLUTION_TEMPLATE = Template("""# 技术方案文档
 
 **文档版本:** 1.0  
-**生成时间:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**文档类型:** {solution_type.title()}  
+**生成时间:** $generated  
+**文档类型:** $solution_type  
 **状态:** 草稿
 
 ---
@@ -688,12 +685,23 @@ gantt
 | 测试负责人 | | | |
 | 项目经理 | | | |
 
-"""
+""")
+
+
+def generate_technical_solution(prd_content: str, output: str, solution_type: str = 'full'):
+    """Generate complete technical solution from PRD"""
+    
+    print(f"🏗️  Generating technical solution from PRD...")
+    print(f"📋 PRD: {prd_content[:100]}...")
+    
+    content = _SOLUTION_TEMPLATE.substitute(
+        generated=time.strftime('%Y-%m-%d %H:%M:%S'),
+        solution_type=solution_type.title(),
+    )
     
     # Write to file
     output_path = Path(output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    output_path.write_bytes(content.encode('utf-8'))
     
     print(f"✅ 技术方案文档已生成：{output_path}")
     print(f"📊 文档长度：{len(content.split())} 字")
@@ -705,19 +713,33 @@ def main():
     parser = argparse.ArgumentParser(description='Generate technical solution from PRD')
     parser.add_argument('--prd', '-p', required=True, help='PRD content or file path')
     parser.add_argument('--output', '-o', default='technical-solution.md', help='Output file')
-    parser.add_argument('--type', '-t', default='full', 
+    parser.add_argument('--type', '-t', nargs='+', default=['full'], 
                        choices=['full', 'api', 'database', 'architecture'],
-                       help='Solution type')
+                       help='Solution type(s); with several, each goes to <output stem>-<type>')
     
     args = parser.parse_args()
     
-    # Read PRD from file if provided
+    # Read PRD from file if provided. Multi-line text is inline PRD content
+    # and is never looked up; a long single line can still be too long for
+    # the file system to stat, which also means it is not a path
     prd_content = args.prd
-    if Path(prd_content).exists():
-        with open(prd_content, 'r', encoding='utf-8') as f:
-            prd_content = f.read()
+    prd_path = Path(prd_content)
+    try:
+        is_prd_file = '\n' not in prd_content and prd_path.is_file()
+    except OSError:
+        is_prd_file = False
+    if is_prd_file:
+        prd_content = prd_path.read_text(encoding='utf-8')
+    
+    if len(args.type) == 1:
+        generate_technical_solution(prd_content, args.output, args.type[0])
+        return
     
-    generate_technical_solution(prd_content, args.output, args.type)
+    # Several types are generated in this one process, next to each other
+    output = Path(args.output)
+    for solution_type in dict.fromkeys(args.type):
+        type_output = output.with_name(f"{output.stem}-{solution_type}{output.suffix}")
+        generate_technical_solution(prd_content, str(type_output), solution_type)
 
 
 if __name__ == '__main__':